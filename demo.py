@@ -5,8 +5,12 @@ This shows the core functionality and patterns implemented.
 """
 
 import asyncio
+import functools
+import io
+import sys
+from contextlib import redirect_stdout
 from datetime import datetime
-from typing import List
+from typing import Callable, List
 
 # Import our models and patterns
 from src.temporal_platform.models.workflows import (
@@ -15,20 +19,39 @@ from src.temporal_platform.models.workflows import (
 )
 from src.temporal_platform.config.settings import settings
 
+# Sample data is built from literals, so create_sample_data() uses model_construct()
+# to skip Pydantic validators; WorkflowInput below still goes through validation.
+
 print("🚀 Temporal Platform Demonstration")
 print("=" * 50)
 
+def buffered_output(func: Callable[[], None]) -> Callable[[], None]:
+    """Collect a section's print() output and emit it with a single write."""
+    @functools.wraps(func)
+    def wrapper() -> None:
+        buf = io.StringIO()
+        try:
+            with redirect_stdout(buf):
+                func()
+        finally:
+            # Emit whatever was printed even when the section fails part-way
+            sys.stdout.write(buf.getvalue())
+    return wrapper
+
 def create_sample_data() -> List[DataBatch]:
     """Create sample data batches for demonstration."""
     batches = []
     
     for batch_idx in range(3):
         items = []
+        total_size = 0
         for item_idx in range(5):
-            item = DataItem(
-                content=f"Sample data item {item_idx} from batch {batch_idx}",
+            content = f"Sample data item {item_idx} from batch {batch_idx}"
+            size = len(content)
+            item = DataItem.model_construct(
+                content=content,
                 content_type="text/plain",
-                size_bytes=len(f"Sample data item {item_idx} from batch {batch_idx}"),
+                size_bytes=size,
                 metadata={
                     "batch_index": batch_idx,
                     "item_index": item_idx,
@@ -36,11 +59,12 @@ def create_sample_data() -> List[DataBatch]:
                 }
             )
             items.append(item)
+            total_size += size
         
-        batch = DataBatch(
+        batch = DataBatch.model_construct(
             items=items,
             batch_size=len(items),
-            total_size_bytes=sum(item.size_bytes for item in items),
+            total_size_bytes=total_size,
             processing_mode=ProcessingMode.PARALLEL,
             priority=Priority.MEDIUM
         )
@@ -48,6 +72,7 @@ def create_sample_data() -> List[DataBatch]:
     
     return batches
 
+@buffered_output
 def demonstrate_configuration():
     """Demonstrate the configuration system."""
     print("📋 Configuration System")
@@ -63,6 +88,7 @@ def demonstrate_configuration():
     print(f"Elasticsearch Host: {settings.elasticsearch.elasticsearch_host}")
     print()
 
+@buffered_output
 def demonstrate_data_models():
     """Demonstrate the Pydantic data models with validation."""
     print("🏗️  Data Models & Validation")
@@ -94,6 +120,7 @@ def demonstrate_data_models():
     print(f"   Parallel processing: {workflow_input.parallel_batches}")
     print()
 
+@buffered_output
 def demonstrate_error_handling():
     """Demonstrate the custom exception hierarchy."""
     print("🚨 Error Handling System")
@@ -118,6 +145,7 @@ def demonstrate_error_handling():
         print(f"      Context: {error.context}")
         print()
 
+@buffered_output
 def demonstrate_temporal_patterns():
     """Demonstrate the 4 Temporal patterns implemented."""
     print("🔄 Temporal Workflow Patterns")
@@ -157,6 +185,7 @@ def demonstrate_temporal_patterns():
         print(f"   Features: {', '.join(pattern['features'])}")
         print()
 
+@buffered_output
 def demonstrate_production_features():
     """Demonstrate production-ready features."""
     print("🏭 Production-Ready Features")
@@ -179,6 +208,7 @@ def demonstrate_production_features():
         print(f"   {feature}")
     print()
 
+@buffered_output
 def demonstrate_deployment_options():
     """Show the deployment options available."""
     print("🚀 Deployment Options")
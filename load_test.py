@@ -17,24 +17,41 @@ import asyncio
 import time
 import sys
 import os
-from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta
-from dataclasses import dataclass
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Any, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+from dataclasses import dataclass, field
+from uuid import uuid4
 import argparse
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 import json
-import statistics
+import math
+import pickle
+import random
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn
+from rich.progress import Progress, BarColumn, TaskID, TextColumn, TimeRemainingColumn
 from rich.live import Live
 from rich import print as rprint
 
+try:
+    import uvloop
+except ImportError:  # optional: not available on Windows / newer interpreters
+    uvloop = None
+else:
+    if not hasattr(uvloop, "run"):  # uvloop.run() was added in 0.18
+        uvloop = None
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib encoder
+    orjson = None
+
 # Add the src directory to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), 'src')))
 
-from temporalio.client import Client
+from temporalio.client import Client, WorkflowHandle
 from temporalio.common import RetryPolicy
 from temporal_platform.config.settings import Settings
 from temporal_platform.models.workflows import (
@@ -44,7 +61,41 @@ from temporal_platform.workflows.orchestration import DataProcessingOrchestrator
 
 console = Console()
 
-@dataclass
+
+def _json_default(value: Any) -> Any:
+    """Encode datetimes like orjson does when using the stdlib encoder."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _iso_utc(ts: float) -> str:
+    """Format an epoch timestamp as an ISO-8601 UTC string."""
+    return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat()
+
+
+def _dump_json(data: Any, indent: bool = False, newline: bool = False) -> bytes:
+    """Serialize data to JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        option = 0
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if newline:
+            option |= orjson.OPT_APPEND_NEWLINE
+        return orjson.dumps(data, option=option)
+    text = json.dumps(data, indent=2 if indent else None, default=_json_default)
+    return (text + "\n" if newline else text).encode()
+
+_CONTENT_FMT = "Load test data - WF:%s - Batch:%d - Item:%d"
+
+# Spread workflow input generation across processes only above this many items
+GENERATOR_POOL_THRESHOLD = 10_000
+
+# Test data is built from literals we control, so DataItem/DataBatch are created
+# with model_construct(), which skips Pydantic validators. The WorkflowInput
+# template is validated once; per-workflow copies reuse it via model_copy().
+
+@dataclass(slots=True)
 class LoadTestConfig:
     """Configuration for load testing."""
     total_workflows: int = 1000
@@ -55,61 +106,250 @@ class LoadTestConfig:
     ramp_up_time_seconds: int = 60
     enable_monitoring: bool = True
     failure_rate_threshold: float = 0.05  # 5% failure rate threshold
+    generator_processes: int = 0  # 0 = build workflow inputs in-process
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowResult:
     """Result of a single workflow execution."""
     workflow_id: str
-    start_time: datetime
-    end_time: Optional[datetime] = None
+    start_ts: float  # wall-clock epoch seconds
+    end_ts: Optional[float] = None
     status: str = "pending"  # pending, running, completed, failed
     error_message: Optional[str] = None
     execution_time_seconds: Optional[float] = None
     items_processed: int = 0
+    start_monotonic: float = field(default_factory=time.monotonic)  # for duration math
 
 class LoadTestMetrics:
-    """Collects and tracks load testing metrics."""
+    """Collects and tracks load testing metrics.
+    
+    Only running aggregates are kept in memory; when a results path is given,
+    each WorkflowResult is streamed to it as one JSON line.
+    """
+    
+    RESERVOIR_SIZE = 10_000
     
-    def __init__(self):
-        self.results: List[WorkflowResult] = []
+    def __init__(self, results_path: Optional[str] = None):
+        self.results_path = results_path
+        self._fp = open(results_path, "wb") if results_path else None
         self.start_time = datetime.now()
         self.end_time: Optional[datetime] = None
         
+        self.total_count = 0
+        self.completed_count = 0
+        self.failed_count = 0
+        self.total_items_processed = 0
+        self.error_counts: Counter = Counter()
+        
+        # Execution time aggregates for completed workflows (Welford)
+        self._n = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._min: Optional[float] = None
+        self._max: Optional[float] = None
+        self._reservoir: List[float] = []
+        self._rng = random.Random()
+        
     def add_result(self, result: WorkflowResult):
         """Add a workflow result."""
-        self.results.append(result)
+        if self._fp is not None:
+            self._fp.write(_dump_json(self._result_to_dict(result), newline=True))
+            
+        self.total_count += 1
+        if result.status == "completed":
+            self.completed_count += 1
+            self.total_items_processed += result.items_processed
+            if result.execution_time_seconds:
+                self._add_execution_time(result.execution_time_seconds)
+        elif result.status == "failed":
+            self.failed_count += 1
+            if result.error_message:
+                self.error_counts[self._error_key(result.error_message)] += 1
+                
+    def _add_execution_time(self, value: float):
+        """Update running execution time statistics."""
+        self._n += 1
+        delta = value - self._mean
+        self._mean += delta / self._n
+        self._m2 += delta * (value - self._mean)
+        self._min = value if self._min is None else min(self._min, value)
+        self._max = value if self._max is None else max(self._max, value)
+        
+        # Reservoir sample for quantiles
+        if len(self._reservoir) < self.RESERVOIR_SIZE:
+            self._reservoir.append(value)
+        else:
+            slot = self._rng.randrange(self._n)
+            if slot < self.RESERVOIR_SIZE:
+                self._reservoir[slot] = value
+                
+    @staticmethod
+    def _error_key(error_message: str) -> str:
+        """Return the interned error type (text before the first colon)."""
+        return sys.intern(error_message.partition(':')[0])
+        
+    @staticmethod
+    def _result_to_dict(r: WorkflowResult) -> Dict[str, Any]:
+        """Serialize a workflow result for the results file."""
+        return {
+            "workflow_id": r.workflow_id,
+            "start_time": _iso_utc(r.start_ts),
+            "end_time": _iso_utc(r.end_ts) if r.end_ts is not None else None,
+            "status": r.status,
+            "execution_time_seconds": r.execution_time_seconds,
+            "items_processed": r.items_processed,
+            "error_message": r.error_message
+        }
+        
+    def close(self):
+        """Flush and close the results stream."""
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
         
     def get_summary(self) -> Dict[str, Any]:
         """Get comprehensive test summary."""
-        completed = [r for r in self.results if r.status == "completed"]
-        failed = [r for r in self.results if r.status == "failed"]
-        
-        execution_times = [r.execution_time_seconds for r in completed if r.execution_time_seconds]
+        # Sort the sample once and read all order statistics from it
+        samples = sorted(self._reservoir)
+        n = len(samples)
         
         return {
-            "total_workflows": len(self.results),
-            "completed": len(completed),
-            "failed": len(failed),
-            "success_rate": len(completed) / len(self.results) if self.results else 0,
-            "failure_rate": len(failed) / len(self.results) if self.results else 0,
-            "avg_execution_time": statistics.mean(execution_times) if execution_times else 0,
-            "median_execution_time": statistics.median(execution_times) if execution_times else 0,
-            "min_execution_time": min(execution_times) if execution_times else 0,
-            "max_execution_time": max(execution_times) if execution_times else 0,
-            "p95_execution_time": statistics.quantiles(execution_times, n=20)[18] if len(execution_times) > 20 else 0,
-            "p99_execution_time": statistics.quantiles(execution_times, n=100)[98] if len(execution_times) > 100 else 0,
-            "total_items_processed": sum(r.items_processed for r in completed),
-            "throughput_workflows_per_second": len(completed) / (self.end_time - self.start_time).total_seconds() if self.end_time else 0,
+            "total_workflows": self.total_count,
+            "completed": self.completed_count,
+            "failed": self.failed_count,
+            "success_rate": self.completed_count / self.total_count if self.total_count else 0,
+            "failure_rate": self.failed_count / self.total_count if self.total_count else 0,
+            "avg_execution_time": self._mean if self._n else 0,
+            "stddev_execution_time": math.sqrt(self._m2 / self._n) if self._n else 0,
+            "median_execution_time": (samples[(n - 1) // 2] + samples[n // 2]) / 2 if samples else 0,
+            "min_execution_time": self._min if self._n else 0,
+            "max_execution_time": self._max if self._n else 0,
+            "p95_execution_time": samples[int(0.95 * n)] if n > 20 else 0,
+            "p99_execution_time": samples[int(0.99 * n)] if n > 100 else 0,
+            "total_items_processed": self.total_items_processed,
+            "throughput_workflows_per_second": self.completed_count / (self.end_time - self.start_time).total_seconds() if self.end_time else 0,
         }
 
+class WorkflowInputFactory:
+    """Builds load test WorkflowInputs from a shared, pre-validated template."""
+    
+    def __init__(self, batch_size_per_workflow: int, items_per_batch: int):
+        self.batch_size_per_workflow = batch_size_per_workflow
+        self.items_per_batch = items_per_batch
+        self._template = self._build_template()
+        
+    def _build_template(self) -> WorkflowInput:
+        """Build the validated WorkflowInput shape shared by every workflow."""
+        batches = []
+        
+        for batch_idx in range(self.batch_size_per_workflow):
+            items = [
+                DataItem.model_construct(
+                    content="template",
+                    content_type="text/plain",
+                    size_bytes=len("template"),
+                    metadata={
+                        "workflow_id": None,
+                        "batch_index": batch_idx,
+                        "item_index": item_idx,
+                        "test_timestamp": None,
+                        "load_test": True
+                    }
+                )
+                for item_idx in range(self.items_per_batch)
+            ]
+            batch = DataBatch.model_construct(
+                items=items,
+                batch_size=len(items),
+                total_size_bytes=len(items) * len("template"),
+                processing_mode=ProcessingMode.PARALLEL,
+                priority=Priority.MEDIUM
+            )
+            batches.append(batch)
+            
+        return WorkflowInput(
+            dataset_id="load-test-dataset-template",
+            batches=batches,
+            parallel_batches=min(2, len(batches))  # Process max 2 batches in parallel
+        )
+        
+    def create(self, workflow_id: str) -> WorkflowInput:
+        """Create test data for a workflow by copying the shared template.
+        
+        Only the per-workflow fields are replaced; each copy gets fresh ids so
+        items stay unique across workflows.
+        """
+        batches = []
+        now_iso = datetime.now().isoformat()
+
+        for batch_idx, template_batch in enumerate(self._template.batches):
+            items = []
+            total_size = 0
+            for item_idx, template_item in enumerate(template_batch.items):
+                content = _CONTENT_FMT % (workflow_id, batch_idx, item_idx)
+                size = len(content)
+                metadata = template_item.metadata.copy()
+                metadata["workflow_id"] = workflow_id
+                metadata["test_timestamp"] = now_iso
+                item = template_item.model_copy(update={
+                    "id": str(uuid4()),
+                    "content": content,
+                    "size_bytes": size,
+                    "metadata": metadata
+                })
+                items.append(item)
+                total_size += size
+
+            batch = template_batch.model_copy(update={
+                "id": str(uuid4()),
+                "items": items,
+                "total_size_bytes": total_size
+            })
+            batches.append(batch)
+            
+        return self._template.model_copy(update={
+            "id": str(uuid4()),
+            "dataset_id": f"load-test-dataset-{workflow_id}",
+            "batches": batches
+        })
+
+
+def workflow_id_for(workflow_index: int) -> str:
+    """Return the workflow id used for a load test workflow index."""
+    return f"load-test-{workflow_index:06d}"
+
+
+def _build_input_chunk(start: int, count: int, batch_size_per_workflow: int, items_per_batch: int) -> List[bytes]:
+    """Build and pickle WorkflowInputs for a range of workflows (process pool entry point)."""
+    factory = WorkflowInputFactory(batch_size_per_workflow, items_per_batch)
+    return [
+        pickle.dumps(factory.create(workflow_id_for(i)), protocol=pickle.HIGHEST_PROTOCOL)
+        for i in range(start, start + count)
+    ]
+
+
 class TemporalLoadTester:
     """Main load testing orchestrator."""
     
-    def __init__(self, config: LoadTestConfig):
+    def __init__(self, config: LoadTestConfig, results_path: Optional[str] = None):
         self.config = config
         self.settings = Settings()
-        self.metrics = LoadTestMetrics()
+        self.metrics = LoadTestMetrics(results_path)
         self.client: Optional[Client] = None
+        self._input_factory = WorkflowInputFactory(config.batch_size_per_workflow, config.items_per_batch)
+        self._input_chunks: List[asyncio.Future] = []
+        self._input_chunk_size = 0
+        self._done = 0
+        
+        # Start options are identical for every workflow; build them once
+        self._workflow_fn = DataProcessingOrchestrator.run
+        self._task_queue = self.settings.temporal.temporal_task_queue
+        self._exec_timeout = timedelta(minutes=10)
+        self._retry_policy = RetryPolicy(
+            initial_interval=timedelta(seconds=1),
+            maximum_interval=timedelta(seconds=30),
+            maximum_attempts=3,
+        )
         
     async def initialize(self):
         """Initialize Temporal client."""
@@ -117,6 +357,7 @@ class TemporalLoadTester:
             self.client = await Client.connect(
                 f"{self.settings.temporal.temporal_host}:{self.settings.temporal.temporal_port}",
                 namespace=self.settings.temporal.temporal_namespace,
+                identity="load-tester",
             )
             console.print("✅ Connected to Temporal server", style="green")
         except Exception as e:
@@ -125,94 +366,119 @@ class TemporalLoadTester:
             
     def create_test_data(self, workflow_id: str) -> WorkflowInput:
         """Create test data for a workflow."""
-        batches = []
+        return self._input_factory.create(workflow_id)
         
-        for batch_idx in range(self.config.batch_size_per_workflow):
-            items = []
-            for item_idx in range(self.config.items_per_batch):
-                item = DataItem(
-                    content=f"Load test data - WF:{workflow_id} - Batch:{batch_idx} - Item:{item_idx}",
-                    content_type="text/plain",
-                    size_bytes=len(f"Load test data - WF:{workflow_id} - Batch:{batch_idx} - Item:{item_idx}"),
-                    metadata={
-                        "workflow_id": workflow_id,
-                        "batch_index": batch_idx,
-                        "item_index": item_idx,
-                        "test_timestamp": datetime.now().isoformat(),
-                        "load_test": True
-                    }
-                )
-                items.append(item)
-                
-            batch = DataBatch(
-                items=items,
-                batch_size=len(items),
-                total_size_bytes=sum(item.size_bytes for item in items),
-                processing_mode=ProcessingMode.PARALLEL,
-                priority=Priority.MEDIUM
+    def start_input_generators(self, pool: ProcessPoolExecutor) -> None:
+        """Schedule workflow input generation across a process pool."""
+        processes = self.config.generator_processes
+        total = self.config.total_workflows
+        # A few chunks per process keeps the pool busy while early inputs arrive quickly
+        self._input_chunk_size = max(1, math.ceil(total / (processes * 4)))
+        loop = asyncio.get_running_loop()
+        self._input_chunks = [
+            loop.run_in_executor(
+                pool,
+                _build_input_chunk,
+                start,
+                min(self._input_chunk_size, total - start),
+                self.config.batch_size_per_workflow,
+                self.config.items_per_batch,
             )
-            batches.append(batch)
-            
-        return WorkflowInput(
-            dataset_id=f"load-test-dataset-{workflow_id}",
-            batches=batches,
-            parallel_batches=min(2, len(batches))  # Process max 2 batches in parallel
+            for start in range(0, total, self._input_chunk_size)
+        ]
+        
+    def use_input_generators(self) -> bool:
+        """Whether input generation is worth spreading across processes."""
+        return (
+            self.config.generator_processes > 0
+            and self.config.total_workflows * self.config.items_per_batch > GENERATOR_POOL_THRESHOLD
         )
         
-    async def execute_single_workflow(self, workflow_index: int) -> WorkflowResult:
-        """Execute a single workflow and track its performance."""
-        workflow_id = f"load-test-{workflow_index:06d}"
+    async def get_workflow_input(self, workflow_index: int, workflow_id: str) -> WorkflowInput:
+        """Return the input for a workflow, from the process pool when enabled."""
+        if self._input_chunks:
+            chunk = await self._input_chunks[workflow_index // self._input_chunk_size]
+            return pickle.loads(chunk[workflow_index % self._input_chunk_size])
+        return await asyncio.to_thread(self.create_test_data, workflow_id)
+        
+    def _mark_failed(self, result: WorkflowResult, error: Exception) -> WorkflowResult:
+        """Record a failed workflow execution."""
+        result.end_ts = time.time()
+        result.execution_time_seconds = time.monotonic() - result.start_monotonic
+        result.status = "failed"
+        result.error_message = str(error)
+        return result
+        
+    async def submit_workflow(self, workflow_index: int) -> Tuple[WorkflowResult, Optional[WorkflowHandle]]:
+        """Start a single workflow without waiting for it to complete."""
+        workflow_id = workflow_id_for(workflow_index)
         result = WorkflowResult(
             workflow_id=workflow_id,
-            start_time=datetime.now()
+            start_ts=time.time()
         )
         
         try:
-            # Create test data
-            workflow_input = self.create_test_data(workflow_id)
+            # Create test data off the event loop so submissions keep flowing
+            workflow_input = await self.get_workflow_input(workflow_index, workflow_id)
             result.items_processed = sum(len(batch.items) for batch in workflow_input.batches)
             
             # Execute workflow
             result.status = "running"
+            result.start_monotonic = time.monotonic()
             
             workflow_handle = await self.client.start_workflow(
-                DataProcessingOrchestrator.run,
+                self._workflow_fn,
                 workflow_input,
                 id=workflow_id,
-                task_queue=self.settings.temporal.temporal_task_queue,
-                execution_timeout=timedelta(minutes=10),
-                retry_policy=RetryPolicy(
-                    initial_interval=timedelta(seconds=1),
-                    maximum_interval=timedelta(seconds=30),
-                    maximum_attempts=3,
-                )
+                task_queue=self._task_queue,
+                execution_timeout=self._exec_timeout,
+                retry_policy=self._retry_policy
             )
+            return result, workflow_handle
             
-            # Wait for completion
-            workflow_result = await workflow_handle.result()
+        except Exception as e:
+            return self._mark_failed(result, e), None
             
-            result.end_time = datetime.now()
-            result.execution_time_seconds = (result.end_time - result.start_time).total_seconds()
+    async def complete_workflow(self, workflow_handle: WorkflowHandle, result: WorkflowResult) -> WorkflowResult:
+        """Wait for a submitted workflow to finish and track its performance."""
+        try:
+            await workflow_handle.result()
+            
+            result.end_ts = time.time()
+            result.execution_time_seconds = time.monotonic() - result.start_monotonic
             result.status = "completed"
             
         except Exception as e:
-            result.end_time = datetime.now()
-            result.execution_time_seconds = (result.end_time - result.start_time).total_seconds()
-            result.status = "failed"
-            result.error_message = str(e)
+            self._mark_failed(result, e)
             
         return result
         
-    async def execute_batch_workflows(self, workflow_indices: List[int]) -> List[WorkflowResult]:
-        """Execute a batch of workflows concurrently."""
-        tasks = []
+    async def execute_guarded_workflow(
+        self,
+        submit_semaphore: asyncio.Semaphore,
+        complete_semaphore: asyncio.Semaphore,
+        workflow_index: int,
+    ) -> WorkflowResult:
+        """Submit a workflow and await its result under separate concurrency limits.
         
-        for index in workflow_indices:
-            task = asyncio.create_task(self.execute_single_workflow(index))
-            tasks.append(task)
-            
-        return await asyncio.gather(*tasks, return_exceptions=True)
+        Submissions are bounded by `concurrent_limit`, while a deeper pool of
+        in-flight workflows waits on results so the frontend is never starved
+        by slow completions.
+        """
+        async with complete_semaphore:
+            async with submit_semaphore:
+                result, workflow_handle = await self.submit_workflow(workflow_index)
+            if workflow_handle is None:
+                return result
+            return await self.complete_workflow(workflow_handle, result)
         
+    async def _refresh_loop(self, progress: Progress, task_id: TaskID, interval: float = 0.1):
+        """Redraw the progress bar at a fixed cadence."""
+        while True:
+            await asyncio.sleep(interval)
+            progress.update(task_id, completed=self._done)
+            progress.refresh()
+            
     async def run_load_test(self):
         """Run the complete load test."""
         console.print(Panel(
@@ -229,51 +495,65 @@ class TemporalLoadTester:
         # Initialize metrics
         self.metrics.start_time = datetime.now()
         
-        # Create workflow batches
-        workflow_batches = []
-        for i in range(0, self.config.total_workflows, self.config.concurrent_limit):
-            batch = list(range(i, min(i + self.config.concurrent_limit, self.config.total_workflows)))
-            workflow_batches.append(batch)
+        # Pre-build workflow inputs on all cores for large runs
+        pool = None
+        if self.use_input_generators():
+            pool = ProcessPoolExecutor(max_workers=self.config.generator_processes)
+            self.start_input_generators(pool)
+            
+        # Keep the pipeline full instead of waiting for each wave to drain
+        # before starting the next one
+        submit_semaphore = asyncio.Semaphore(self.config.concurrent_limit)
+        complete_semaphore = asyncio.Semaphore(self.config.concurrent_limit * 4)
+        tasks = [
+            asyncio.create_task(
+                self.execute_guarded_workflow(submit_semaphore, complete_semaphore, i)
+            )
+            for i in range(self.config.total_workflows)
+        ]
             
         # Execute workflows with progress tracking
+        # Rendering is throttled to a background refresh loop; the hot loop
+        # below only bumps a counter
         with Progress(
             TextColumn("[progress.description]{task.description}"),
             BarColumn(),
             "[progress.percentage]{task.percentage:>3.0f}%",
             "•",
             TimeRemainingColumn(),
-            console=console
+            console=console,
+            auto_refresh=False
         ) as progress:
             
             overall_task = progress.add_task("Overall Progress", total=self.config.total_workflows)
-            batch_task = progress.add_task("Current Batch", total=len(workflow_batches))
+            self._done = 0
+            refresh_task = asyncio.create_task(self._refresh_loop(progress, overall_task))
             
-            for batch_idx, workflow_indices in enumerate(workflow_batches):
-                progress.update(batch_task, description=f"Batch {batch_idx + 1}/{len(workflow_batches)}")
-                
-                # Execute batch
-                batch_results = await self.execute_batch_workflows(workflow_indices)
-                
-                # Process results
-                for result in batch_results:
-                    if isinstance(result, Exception):
-                        # Handle exceptions from gather
-                        error_result = WorkflowResult(
-                            workflow_id=f"error-{len(self.metrics.results)}",
-                            start_time=datetime.now(),
-                            end_time=datetime.now(),
+            try:
+                for next_result in asyncio.as_completed(tasks):
+                    try:
+                        result = await next_result
+                    except Exception as e:
+                        now_ts = time.time()
+                        result = WorkflowResult(
+                            workflow_id=f"error-{self.metrics.total_count}",
+                            start_ts=now_ts,
+                            end_ts=now_ts,
                             status="failed",
-                            error_message=str(result)
+                            error_message=str(e)
                         )
-                        self.metrics.add_result(error_result)
-                    else:
-                        self.metrics.add_result(result)
-                        
-                progress.update(overall_task, advance=len(workflow_indices))
-                progress.update(batch_task, advance=1)
-                
-                # Add small delay between batches to prevent overwhelming
-                await asyncio.sleep(0.1)
+                    self.metrics.add_result(result)
+                    self._done += 1
+            finally:
+                refresh_task.cancel()
+                try:
+                    await refresh_task
+                except asyncio.CancelledError:
+                    pass
+                progress.update(overall_task, completed=self._done)
+                progress.refresh()
+                if pool is not None:
+                    pool.shutdown(wait=False, cancel_futures=True)
                 
         self.metrics.end_time = datetime.now()
         
@@ -296,6 +576,7 @@ class TemporalLoadTester:
         table.add_section()
         table.add_row("⏱️  Avg Execution Time", f"{summary['avg_execution_time']:.2f}s", "")
         table.add_row("📈 Median Execution Time", f"{summary['median_execution_time']:.2f}s", "")
+        table.add_row("📐 Std Dev Execution Time", f"{summary['stddev_execution_time']:.2f}s", "")
         table.add_row("⚡ Min Execution Time", f"{summary['min_execution_time']:.2f}s", "")
         table.add_row("🐌 Max Execution Time", f"{summary['max_execution_time']:.2f}s", "")
         table.add_row("📊 95th Percentile", f"{summary['p95_execution_time']:.2f}s", "")
@@ -322,23 +603,26 @@ class TemporalLoadTester:
             error_table.add_column("Count", style="yellow")
             error_table.add_column("Percentage", style="dim")
             
-            error_counts = {}
-            for result in self.metrics.results:
-                if result.status == "failed" and result.error_message:
-                    error_type = result.error_message.split(':')[0] if ':' in result.error_message else result.error_message
-                    error_counts[error_type] = error_counts.get(error_type, 0) + 1
-                    
-            for error_type, count in sorted(error_counts.items(), key=lambda x: x[1], reverse=True):
+            for error_type, count in self.metrics.error_counts.most_common():
                 percentage = (count / summary['failed']) * 100
                 error_table.add_row(error_type, str(count), f"{percentage:.1f}%")
                 
             console.print(error_table)
             
     def save_results(self, filename: str = None):
-        """Save detailed results to JSON file."""
+        """Save the test summary to a JSON file.
+        
+        Detailed per-workflow results are streamed to the metrics results
+        file while the test runs; this flushes that stream and records its path.
+        """
+        self.metrics.close()
+        
         if filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"load_test_results_{timestamp}.json"
+            if self.metrics.results_path:
+                filename = os.path.splitext(self.metrics.results_path)[0] + ".json"
+            else:
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                filename = f"load_test_results_{timestamp}.json"
             
         results_data = {
             "config": {
@@ -348,24 +632,15 @@ class TemporalLoadTester:
                 "items_per_batch": self.config.items_per_batch,
             },
             "summary": self.metrics.get_summary(),
-            "detailed_results": [
-                {
-                    "workflow_id": r.workflow_id,
-                    "start_time": r.start_time.isoformat(),
-                    "end_time": r.end_time.isoformat() if r.end_time else None,
-                    "status": r.status,
-                    "execution_time_seconds": r.execution_time_seconds,
-                    "items_processed": r.items_processed,
-                    "error_message": r.error_message
-                }
-                for r in self.metrics.results
-            ]
+            "detailed_results_file": self.metrics.results_path,
         }
         
-        with open(filename, 'w') as f:
-            json.dump(results_data, f, indent=2, default=str)
+        with open(filename, 'wb') as f:
+            f.write(_dump_json(results_data, indent=True))
             
         console.print(f"📁 Results saved to: {filename}", style="green")
+        if self.metrics.results_path:
+            console.print(f"📁 Detailed results streamed to: {self.metrics.results_path}", style="green")
 
 async def main():
     """Main entry point for the load test."""
@@ -374,7 +649,8 @@ async def main():
     parser.add_argument("--concurrent", type=int, default=50, help="Maximum concurrent workflows")
     parser.add_argument("--batch-size", type=int, default=5, help="Number of batches per workflow")
     parser.add_argument("--items-per-batch", type=int, default=10, help="Number of items per batch")
-    parser.add_argument("--save-results", action="store_true", help="Save results to JSON file")
+    parser.add_argument("--generator-processes", type=int, default=0, help="Processes used to pre-build workflow inputs for large runs (0 disables)")
+    parser.add_argument("--save-results", action="store_true", help="Save results to JSON/JSONL files")
     
     args = parser.parse_args()
     
@@ -383,11 +659,18 @@ async def main():
         total_workflows=args.workflows,
         concurrent_limit=args.concurrent,
         batch_size_per_workflow=args.batch_size,
-        items_per_batch=args.items_per_batch
+        items_per_batch=args.items_per_batch,
+        generator_processes=args.generator_processes
     )
     
+    # Stream detailed results to disk as they complete when saving is enabled
+    results_path = None
+    if args.save_results:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        results_path = f"load_test_results_{timestamp}.jsonl"
+    
     # Initialize and run load test
-    tester = TemporalLoadTester(config)
+    tester = TemporalLoadTester(config, results_path)
     
     try:
         await tester.initialize()
@@ -403,6 +686,11 @@ async def main():
     except Exception as e:
         console.print(f"❌ Load test failed: {e}", style="red")
         raise
+    finally:
+        tester.metrics.close()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
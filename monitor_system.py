@@ -15,9 +15,14 @@ import time
 import sys
 import os
 import json
-from typing import Dict, Any, List
+from typing import Callable, Deque, Dict, Any, List, Optional
 from datetime import datetime
 import argparse
+import aiohttp
+import shutil
+import subprocess
+import threading
+from collections import deque
 import psutil
 from rich.console import Console
 from rich.table import Table
@@ -25,6 +30,11 @@ from rich.panel import Panel
 from rich.live import Live
 from rich.layout import Layout
 
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib encoder
+    orjson = None
+
 # Add the src directory to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), 'src')))
 
@@ -32,108 +42,483 @@ from temporal_platform.config.settings import Settings
 
 console = Console()
 
+DOCKER_CONTAINERS = [
+    'deployment-task-temporal-server-1',
+    'deployment-task-postgres-1', 
+    'deployment-task-elasticsearch-1',
+    'temporal-ui-working'
+]
+
+# Socket and process counts are refreshed every Nth tick
+SLOW_METRICS_EVERY = 6
+
+# Ticks kept in memory; the full history goes to the --save-metrics stream
+METRICS_HISTORY_CAP = 10_000
+
+# Seconds a disk usage reading is reused before calling statvfs again
+DISK_USAGE_TTL = 30
+
+# Seconds to wait before re-resolving a container whose stats stream ended
+RESOLVE_RETRY_DELAY = 2
+
+PROC_NET_SOCKET_TABLES = ('/proc/net/tcp', '/proc/net/tcp6', '/proc/net/udp', '/proc/net/udp6')
+
+def dump_metrics_line(metrics: Dict[str, Any]) -> bytes:
+    """Serialize one metrics sample as a newline-terminated JSON line."""
+    if orjson is not None:
+        return orjson.dumps(metrics, default=str, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(metrics, default=str, separators=(',', ':')) + '\n').encode()
+
+def load_json(body: bytes) -> Any:
+    """Decode a raw JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+# Usage percentages below each threshold get the matching emoji; anything above is red
+STATUS_THRESHOLDS = ((80, "🟢"), (95, "🟡"))
+
+def status_emoji(percent: float) -> str:
+    """Map a usage percentage to its dashboard status emoji."""
+    for threshold, emoji in STATUS_THRESHOLDS:
+        if percent < threshold:
+            return emoji
+    return "🔴"
+
+# Host-wide metrics keyed by name as (monotonic timestamp, value), so several
+# monitors in one process sample psutil once per interval between them
+_PROCESS_METRICS_CACHE: Dict[str, tuple] = {}
+
+def process_level_metric(name: str, max_age: float, collect: Callable[[], Any]) -> Any:
+    """Return a cached host-wide metric, re-collecting it once older than max_age seconds."""
+    now = time.monotonic()
+    cached = _PROCESS_METRICS_CACHE.get(name)
+    if cached is not None and now - cached[0] < max_age:
+        return cached[1]
+    value = collect()
+    _PROCESS_METRICS_CACHE[name] = (now, value)
+    return value
+
+BYTES_PER_MB = 1024 * 1024
+
+def container_usage(cpu_delta: float, system_cpu_delta: float, ncpus: int,
+                    memory_usage: int, memory_limit: int) -> tuple:
+    """Turn raw counter deltas into (cpu_percent, memory_mb, memory_percent)."""
+    cpu_percent = (cpu_delta / system_cpu_delta) * ncpus * 100.0 if system_cpu_delta else 0.0
+    return cpu_percent, memory_usage / BYTES_PER_MB, (memory_usage / memory_limit) * 100.0
+
+class DockerStatsStreamer:
+    """Keeps the latest stats sample for each container from long-lived stats streams.
+    
+    One background reader thread per container consumes `container.stats(stream=True)`
+    so that a monitoring tick only transforms cached samples instead of making a
+    blocking HTTP round-trip to dockerd for every container.
+    """
+    
+    def __init__(self, container_names: List[str]):
+        self.container_names = list(container_names)
+        self._client = None
+        # Guards client creation, which the reader threads retry until dockerd is up
+        self._client_lock = threading.Lock()
+        self._error: Optional[str] = None
+        self._containers: Dict[str, Any] = {}
+        self._latest: Dict[str, Dict[str, Any]] = {}
+        self._status: Dict[str, str] = {}
+        self._errors: Dict[str, str] = {}
+        self._threads: Dict[str, threading.Thread] = {}
+        self._stopped = threading.Event()
+        
+    def start(self):
+        """Open a stats stream per container."""
+        for name in self.container_names:
+            self._start_reader(name)
+            
+    def add(self, name: str):
+        """Start streaming one more container."""
+        if name not in self._threads:
+            self.container_names.append(name)
+            self._start_reader(name)
+            
+    def _start_reader(self, name: str):
+        thread = threading.Thread(target=self._reader_loop, args=(name,), daemon=True)
+        self._threads[name] = thread
+        thread.start()
+        
+    def stop(self):
+        """Stop all stats streams."""
+        self._stopped.set()
+        with self._client_lock:
+            if self._client is not None:
+                # Closing the client tears down the open stream connections,
+                # which unblocks the reader threads
+                self._client.close()
+                self._client = None
+                
+    def _get_client(self):
+        """Return the shared Docker client, creating it if dockerd was unreachable so far."""
+        with self._client_lock:
+            if self._client is None and not self._stopped.is_set():
+                try:
+                    import docker
+                    self._client = docker.from_env()
+                except Exception as e:
+                    self._error = f"Docker not available: {e}"
+                    return None
+                self._error = None
+            return self._client
+            
+    def _reader_loop(self, name: str):
+        """Consume a container's stats stream, caching the newest sample.
+        
+        The container handle is resolved once and reused; it is only looked up
+        again when the stream ends or fails, e.g. after a container restart.
+        Client creation is retried the same way while dockerd is unavailable.
+        """
+        while not self._stopped.is_set():
+            client = self._get_client()
+            if client is None:
+                self._stopped.wait(RESOLVE_RETRY_DELAY)
+                continue
+            try:
+                container = self._containers.get(name)
+                if container is None:
+                    container = self._containers[name] = client.containers.get(name)
+                    self._status[name] = container.status
+                    self._errors.pop(name, None)
+                for raw in container.stats(stream=True, decode=True):
+                    if self._stopped.is_set():
+                        return
+                    self._latest[name] = raw
+            except Exception as e:
+                if self._stopped.is_set():
+                    return
+                self._errors[name] = str(e)
+                self._latest.pop(name, None)
+            self._containers.pop(name, None)
+            self._stopped.wait(RESOLVE_RETRY_DELAY)
+                
+    def snapshot(self) -> Dict[str, Any]:
+        """Compute container metrics from the cached samples."""
+        if self._error:
+            return {'error': self._error}
+            
+        metrics = {}
+        for container_name in self.container_names:
+            stats = self._latest.get(container_name)
+            if stats is None:
+                metrics[container_name] = {'error': self._errors.get(container_name, 'No stats received yet')}
+                continue
+                
+            try:
+                cpu_stats = stats['cpu_stats']
+                precpu_stats = stats['precpu_stats']
+                memory_stats = stats['memory_stats']
+                cpu_percent, memory_mb, memory_percent = container_usage(
+                    cpu_stats['cpu_usage']['total_usage'] - precpu_stats['cpu_usage']['total_usage'],
+                    cpu_stats['system_cpu_usage'] - precpu_stats['system_cpu_usage'],
+                    len(cpu_stats['cpu_usage']['percpu_usage']),
+                    memory_stats['usage'],
+                    memory_stats['limit'],
+                )
+                
+                metrics[container_name] = {
+                    'status': self._status.get(container_name, 'unknown'),
+                    'cpu_percent': cpu_percent,
+                    'memory_usage_mb': memory_mb,
+                    'memory_percent': memory_percent,
+                    'network_rx_bytes': stats['networks']['deployment-task_temporal-network']['rx_bytes'] if 'networks' in stats else 0,
+                    'network_tx_bytes': stats['networks']['deployment-task_temporal-network']['tx_bytes'] if 'networks' in stats else 0,
+                }
+            except Exception as e:
+                metrics[container_name] = {'error': str(e)}
+                
+        return metrics
+
+class CgroupStatsReader:
+    """Reads container CPU, memory and network usage straight from cgroup v2 and procfs.
+    
+    Container ids and PIDs are resolved via `docker inspect` and reused; after that
+    every sample is a handful of pseudo-file reads instead of a dockerd HTTP round-trip.
+    A container is resolved again when it was missing or its reads start failing,
+    e.g. after a restart. Containers whose cgroup cannot be located are handed to a
+    DockerStatsStreamer. Only usable on Linux hosts running the unified (v2) cgroup hierarchy.
+    """
+    
+    CGROUP_ROOT = '/sys/fs/cgroup'
+    
+    def __init__(self, container_names: List[str]):
+        self.container_names = container_names
+        self._containers: Dict[str, Dict[str, Any]] = {}
+        self._errors: Dict[str, str] = {}
+        # Monotonic time of the last failed resolve attempt per container
+        self._resolve_failed_at: Dict[str, float] = {}
+        self._prev_cpu: Dict[str, tuple] = {}
+        self._host_memory = psutil.virtual_memory().total
+        self._fallback: Optional[DockerStatsStreamer] = None
+        
+    @classmethod
+    def available(cls) -> bool:
+        """Whether cgroup v2 and the docker CLI are present on this host."""
+        return (
+            os.path.exists(os.path.join(cls.CGROUP_ROOT, 'cgroup.controllers'))
+            and shutil.which('docker') is not None
+        )
+        
+    def start(self):
+        """Resolve container ids, PIDs and cgroup directories."""
+        for name in self.container_names:
+            self._resolve(name)
+            
+    def stop(self):
+        """Stop the stats streams of any containers using the dockerd fallback."""
+        if self._fallback is not None:
+            self._fallback.stop()
+            
+    def _resolve(self, name: str):
+        """Look up a container's cgroup directory, PID and current status."""
+        try:
+            output = subprocess.run(
+                ['docker', 'inspect', '-f', '{{.Id}} {{.State.Pid}} {{.State.Status}}', name],
+                capture_output=True, text=True, timeout=5, check=True
+            ).stdout.split()
+            container_id, pid, status = output[0], int(output[1]), output[2]
+            if status != 'running':
+                # A stopped container has no cgroup; try again once it is back
+                raise RuntimeError(f"Container is {status}")
+            cgroup_dir = self._find_cgroup_dir(container_id)
+            if cgroup_dir is None:
+                # Unknown cgroup layout (e.g. rootless or another driver): stream
+                # this container's stats from dockerd instead
+                if self._fallback is None:
+                    self._fallback = DockerStatsStreamer([])
+                self._fallback.add(name)
+                self._errors[name] = 'No stats received yet'
+                return
+            self._containers[name] = {'cgroup': cgroup_dir, 'pid': pid, 'status': status}
+            self._errors.pop(name, None)
+            self._resolve_failed_at.pop(name, None)
+        except Exception as e:
+            self._errors[name] = str(e)
+            self._resolve_failed_at[name] = time.monotonic()
+            
+    def _find_cgroup_dir(self, container_id: str) -> Optional[str]:
+        """Locate a container's cgroup for the systemd and cgroupfs drivers."""
+        for candidate in (
+            os.path.join(self.CGROUP_ROOT, 'system.slice', f'docker-{container_id}.scope'),
+            os.path.join(self.CGROUP_ROOT, 'docker', container_id),
+        ):
+            if os.path.isdir(candidate):
+                return candidate
+        return None
+        
+    @staticmethod
+    def _read(path: str) -> bytes:
+        """Read a small pseudo-file with a single read syscall."""
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            return os.read(fd, 65536)
+        finally:
+            os.close(fd)
+            
+    def _network_bytes(self, pid: int) -> tuple:
+        """Sum rx/tx bytes over the container's non-loopback interfaces."""
+        rx = tx = 0
+        for line in self._read(f'/proc/{pid}/net/dev').splitlines()[2:]:
+            iface, _, counters = line.partition(b':')
+            if iface.strip() == b'lo':
+                continue
+            fields = counters.split()
+            rx += int(fields[0])
+            tx += int(fields[8])
+        return rx, tx
+        
+    def snapshot(self) -> Dict[str, Any]:
+        """Sample every resolved container."""
+        metrics = {}
+        fallback = self._fallback.snapshot() if self._fallback is not None else {}
+        for container_name in self.container_names:
+            if self._fallback is not None and container_name in self._fallback.container_names:
+                metrics[container_name] = fallback.get(container_name) or {'error': fallback.get('error', 'No stats received yet')}
+                continue
+                
+            info = self._containers.get(container_name)
+            if info is None:
+                failed_at = self._resolve_failed_at.get(container_name)
+                if failed_at is None or time.monotonic() - failed_at >= RESOLVE_RETRY_DELAY:
+                    self._resolve(container_name)
+                info = self._containers.get(container_name)
+            if info is None:
+                metrics[container_name] = {'error': self._errors.get(container_name, 'Container not resolved')}
+                continue
+                
+            try:
+                cgroup = info['cgroup']
+                now = time.monotonic()
+                usage_usec = 0
+                for line in self._read(os.path.join(cgroup, 'cpu.stat')).splitlines():
+                    if line.startswith(b'usage_usec '):
+                        usage_usec = int(line.split()[1])
+                        break
+                        
+                # CPU percentage relative to one core, matching `docker stats`
+                cpu_delta = elapsed_usec = 0
+                prev = self._prev_cpu.get(container_name)
+                if prev is not None and now > prev[0]:
+                    cpu_delta = usage_usec - prev[1]
+                    elapsed_usec = (now - prev[0]) * 1_000_000
+                self._prev_cpu[container_name] = (now, usage_usec)
+                
+                # Memory usage
+                memory_usage = int(self._read(os.path.join(cgroup, 'memory.current')))
+                memory_max = self._read(os.path.join(cgroup, 'memory.max')).strip()
+                memory_limit = self._host_memory if memory_max == b'max' else int(memory_max)
+                
+                cpu_percent, memory_mb, memory_percent = container_usage(
+                    cpu_delta, elapsed_usec, 1, memory_usage, memory_limit
+                )
+                rx_bytes, tx_bytes = self._network_bytes(info['pid'])
+                
+                metrics[container_name] = {
+                    'status': info['status'],
+                    'cpu_percent': cpu_percent,
+                    'memory_usage_mb': memory_mb,
+                    'memory_percent': memory_percent,
+                    'network_rx_bytes': rx_bytes,
+                    'network_tx_bytes': tx_bytes,
+                }
+            except Exception as e:
+                # The container probably restarted or stopped; resolve it again
+                # (picking up its new status) after RESOLVE_RETRY_DELAY
+                metrics[container_name] = {'error': str(e)}
+                self._containers.pop(container_name, None)
+                self._prev_cpu.pop(container_name, None)
+                self._errors[container_name] = str(e)
+                self._resolve_failed_at[container_name] = time.monotonic()
+                
+        return metrics
+
 class SystemMonitor:
     """Real-time system monitoring for Temporal Platform."""
     
-    def __init__(self, interval: int = 5):
+    def __init__(self, interval: int = 5, metrics_path: Optional[str] = None):
         self.settings = Settings()
         self.interval = interval
-        self.metrics_history: List[Dict[str, Any]] = []
+        self.metrics_history: Deque[Dict[str, Any]] = deque(maxlen=METRICS_HISTORY_CAP)
+        # When set, every tick is appended to this file as one JSON line
+        self.metrics_path = metrics_path
+        self._metrics_fp = None
         self.start_time = datetime.now()
+        self._session: Optional[aiohttp.ClientSession] = None
+        # (monotonic timestamp, percent) of the last disk usage reading
+        self._disk_cache = (float('-inf'), 0.0)
+        # Prefer direct cgroup reads on Linux; fall back to the dockerd stats API
+        if CgroupStatsReader.available():
+            self.docker_stats = CgroupStatsReader(DOCKER_CONTAINERS)
+        else:
+            self.docker_stats = DockerStatsStreamer(DOCKER_CONTAINERS)
+        self._build_dashboard()
         
     async def collect_docker_metrics(self) -> Dict[str, Any]:
-        """Collect Docker container metrics."""
-        try:
-            import docker
-            client = docker.from_env()
+        """Collect Docker container metrics from the latest streamed samples."""
+        # The cgroup reader does file I/O, so keep it off the event loop as well
+        return await asyncio.to_thread(self.docker_stats.snapshot)
             
-            metrics = {}
-            containers = [
-                'deployment-task-temporal-server-1',
-                'deployment-task-postgres-1', 
-                'deployment-task-elasticsearch-1',
-                'temporal-ui-working'
-            ]
-            
-            for container_name in containers:
-                try:
-                    container = client.containers.get(container_name)
-                    stats = container.stats(stream=False)
-                    
-                    # Calculate CPU percentage
-                    cpu_delta = stats['cpu_stats']['cpu_usage']['total_usage'] - \
-                               stats['precpu_stats']['cpu_usage']['total_usage']
-                    system_cpu_delta = stats['cpu_stats']['system_cpu_usage'] - \
-                                      stats['precpu_stats']['system_cpu_usage']
-                    cpu_percent = (cpu_delta / system_cpu_delta) * len(stats['cpu_stats']['cpu_usage']['percpu_usage']) * 100.0
-                    
-                    # Memory usage
-                    memory_usage = stats['memory_stats']['usage']
-                    memory_limit = stats['memory_stats']['limit']
-                    memory_percent = (memory_usage / memory_limit) * 100.0
-                    
-                    metrics[container_name] = {
-                        'status': container.status,
-                        'cpu_percent': cpu_percent,
-                        'memory_usage_mb': memory_usage / (1024 * 1024),
-                        'memory_percent': memory_percent,
-                        'network_rx_bytes': stats['networks']['deployment-task_temporal-network']['rx_bytes'] if 'networks' in stats else 0,
-                        'network_tx_bytes': stats['networks']['deployment-task_temporal-network']['tx_bytes'] if 'networks' in stats else 0,
-                    }
-                except Exception as e:
-                    metrics[container_name] = {'error': str(e)}
-                    
-            return metrics
-        except Exception as e:
-            return {'error': f"Docker not available: {e}"}
+    @staticmethod
+    def count_inet_sockets() -> int:
+        """Count inet sockets by reading /proc/net directly where available.
+        
+        psutil.net_connections() builds an object per socket and maps inodes to
+        PIDs, which makes it the most expensive call in a tick; only the count is needed.
+        """
+        if not os.path.exists(PROC_NET_SOCKET_TABLES[0]):
+            return len(psutil.net_connections())
             
+        total = 0
+        for path in PROC_NET_SOCKET_TABLES:
+            try:
+                with open(path, 'rb') as f:
+                    total += sum(1 for _ in f) - 1  # skip header line
+            except OSError:
+                continue
+        return total
+        
     async def collect_system_metrics(self) -> Dict[str, Any]:
-        """Collect host system metrics."""
+        """Collect host system metrics on a worker thread.
+        
+        psutil reads /proc synchronously; running it off the event loop lets the
+        connectivity probes progress at the same time.
+        """
+        return await asyncio.to_thread(self._sync_system_snapshot)
+        
+    def _sync_system_snapshot(self) -> Dict[str, Any]:
+        """Blocking part of collect_system_metrics."""
+        metrics = self.collect_process_level_metrics()
+        
+        # statvfs can block for a while on network filesystems and barely changes
+        now = time.monotonic()
+        if now - self._disk_cache[0] > DISK_USAGE_TTL:
+            self._disk_cache = (now, psutil.disk_usage('/').percent)
+        metrics['disk_usage_percent'] = self._disk_cache[1]
+        return metrics
+        
+    def collect_process_level_metrics(self) -> Dict[str, Any]:
+        """Collect host-wide gauges, shared by every monitor in this process.
+        
+        Cheap gauges are reused for up to one interval; socket and process counts
+        change slowly and are refreshed every SLOW_METRICS_EVERY intervals.
+        """
+        slow_max_age = self.interval * SLOW_METRICS_EVERY
         return {
-            'cpu_percent': psutil.cpu_percent(interval=None),
-            'memory_percent': psutil.virtual_memory().percent,
-            'disk_usage_percent': psutil.disk_usage('/').percent,
-            'load_average': os.getloadavg() if hasattr(os, 'getloadavg') else [0, 0, 0],
-            'network_connections': len(psutil.net_connections()),
-            'processes': len(psutil.pids()),
+            'cpu_percent': process_level_metric('cpu_percent', self.interval, lambda: psutil.cpu_percent(interval=None)),
+            'memory_percent': process_level_metric('memory_percent', self.interval, lambda: psutil.virtual_memory().percent),
+            'load_average': process_level_metric(
+                'load_average', self.interval,
+                lambda: os.getloadavg() if hasattr(os, 'getloadavg') else [0, 0, 0]
+            ),
+            'network_connections': process_level_metric('network_connections', slow_max_age, self.count_inet_sockets),
+            'processes': process_level_metric('processes', slow_max_age, lambda: len(psutil.pids())),
         }
         
+    async def _probe(self, url: str, parse_json: bool = False) -> Dict[str, Any]:
+        """Time a GET request, optionally decoding a JSON body."""
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        async with self._session.get(url) as response:
+            response_time = loop.time() - start_time
+            result = {
+                'status_code': response.status,
+                'response_time_ms': response_time * 1000,
+                'healthy': response.status == 200
+            }
+            if parse_json:
+                result['data'] = load_json(await response.read())
+            return result
+            
     async def test_temporal_connectivity(self) -> Dict[str, Any]:
         """Test Temporal server connectivity and response times."""
-        import aiohttp
+        # Both probes are independent, so run them concurrently
+        ui_res, es_res = await asyncio.gather(
+            self._probe('http://localhost:8080/api/v1/cluster-info'),
+            self._probe('http://localhost:9200/_cluster/health', parse_json=True),
+            return_exceptions=True
+        )
         
         results = {}
-        timeout = aiohttp.ClientTimeout(total=5)
         
-        # Test Temporal UI
-        try:
-            start_time = time.time()
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get('http://localhost:8080/api/v1/cluster-info') as response:
-                    response_time = time.time() - start_time
-                    results['temporal_ui'] = {
-                        'status_code': response.status,
-                        'response_time_ms': response_time * 1000,
-                        'healthy': response.status == 200
-                    }
-        except Exception as e:
-            results['temporal_ui'] = {'error': str(e), 'healthy': False}
+        # Temporal UI
+        if isinstance(ui_res, Exception):
+            results['temporal_ui'] = {'error': str(ui_res), 'healthy': False}
+        else:
+            results['temporal_ui'] = ui_res
             
-        # Test Elasticsearch
-        try:
-            start_time = time.time()
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get('http://localhost:9200/_cluster/health') as response:
-                    response_time = time.time() - start_time
-                    data = await response.json()
-                    results['elasticsearch'] = {
-                        'status_code': response.status,
-                        'response_time_ms': response_time * 1000,
-                        'cluster_status': data.get('status', 'unknown'),
-                        'healthy': response.status == 200 and data.get('status') in ['green', 'yellow']
-                    }
-        except Exception as e:
-            results['elasticsearch'] = {'error': str(e), 'healthy': False}
+        # Elasticsearch
+        if isinstance(es_res, Exception):
+            results['elasticsearch'] = {'error': str(es_res), 'healthy': False}
+        else:
+            data = es_res.pop('data')
+            es_res['cluster_status'] = data.get('status', 'unknown')
+            es_res['healthy'] = es_res['healthy'] and data.get('status') in ['green', 'yellow']
+            results['elasticsearch'] = es_res
             
         return results
         
@@ -158,21 +543,44 @@ class SystemMonitor:
             'connectivity': connectivity_metrics
         }
         
-    def create_dashboard_layout(self, metrics: Dict[str, Any]) -> Layout:
-        """Create a rich dashboard layout."""
-        layout = Layout()
+    def _build_dashboard(self) -> None:
+        """Build the layout skeleton once; ticks swap in freshly filled tables."""
+        self._layout = Layout()
         
-        layout.split_column(
+        self._layout.split_column(
             Layout(name="header", size=3),
             Layout(name="main"),
             Layout(name="footer", size=3),
         )
         
-        layout["main"].split_row(
+        self._layout["main"].split_row(
             Layout(name="left"),
             Layout(name="right"),
         )
         
+    @staticmethod
+    def _new_system_table() -> Table:
+        """Create an empty system metrics table."""
+        table = Table(title="🖥️  System Resources")
+        table.add_column("Metric", style="cyan")
+        table.add_column("Value", style="green")
+        table.add_column("Status", style="yellow")
+        return table
+        
+    @staticmethod
+    def _new_docker_table() -> Table:
+        """Create an empty Docker containers table."""
+        table = Table(title="🐳 Docker Containers")
+        table.add_column("Container", style="cyan")
+        table.add_column("Status", style="green")
+        table.add_column("CPU %", style="yellow")
+        table.add_column("Memory MB", style="blue")
+        return table
+        
+    def create_dashboard_layout(self, metrics: Dict[str, Any]) -> Layout:
+        """Refresh the rich dashboard layout with the latest metrics."""
+        layout = self._layout
+        
         # Header
         uptime_mins = metrics['uptime_seconds'] / 60
         layout["header"].update(Panel(
@@ -181,30 +589,18 @@ class SystemMonitor:
         ))
         
         # System metrics table
-        system_table = Table(title="🖥️  System Resources")
-        system_table.add_column("Metric", style="cyan")
-        system_table.add_column("Value", style="green")
-        system_table.add_column("Status", style="yellow")
+        system_table = self._new_system_table()
         
         system = metrics['system']
-        system_table.add_row("CPU Usage", f"{system['cpu_percent']:.1f}%", 
-                            "🟢" if system['cpu_percent'] < 80 else "🟡" if system['cpu_percent'] < 95 else "🔴")
-        system_table.add_row("Memory Usage", f"{system['memory_percent']:.1f}%",
-                            "🟢" if system['memory_percent'] < 80 else "🟡" if system['memory_percent'] < 95 else "🔴")
-        system_table.add_row("Disk Usage", f"{system['disk_usage_percent']:.1f}%",
-                            "🟢" if system['disk_usage_percent'] < 80 else "🟡" if system['disk_usage_percent'] < 95 else "🔴")
+        system_table.add_row("CPU Usage", f"{system['cpu_percent']:.1f}%", status_emoji(system['cpu_percent']))
+        system_table.add_row("Memory Usage", f"{system['memory_percent']:.1f}%", status_emoji(system['memory_percent']))
+        system_table.add_row("Disk Usage", f"{system['disk_usage_percent']:.1f}%", status_emoji(system['disk_usage_percent']))
         system_table.add_row("Load Average", f"{system['load_average'][0]:.2f}, {system['load_average'][1]:.2f}, {system['load_average'][2]:.2f}", "")
         system_table.add_row("Connections", f"{system['network_connections']}", "")
         system_table.add_row("Processes", f"{system['processes']}", "")
         
-        layout["left"].update(system_table)
-        
         # Docker containers table
-        docker_table = Table(title="🐳 Docker Containers")
-        docker_table.add_column("Container", style="cyan")
-        docker_table.add_column("Status", style="green")
-        docker_table.add_column("CPU %", style="yellow")
-        docker_table.add_column("Memory MB", style="blue")
+        docker_table = self._new_docker_table()
         
         if 'error' not in metrics['docker']:
             for container, data in metrics['docker'].items():
@@ -219,7 +615,9 @@ class SystemMonitor:
                     docker_table.add_row(container, "❌ Error", "-", "-")
         else:
             docker_table.add_row("Docker", "❌ Not Available", "-", "-")
-            
+        
+        # Tables are only swapped in once fully built
+        layout["left"].update(system_table)
         layout["right"].update(docker_table)
         
         # Connectivity status
@@ -244,7 +642,28 @@ class SystemMonitor:
         
         end_time = time.time() + duration if duration else None
         
-        with Live(console=console, refresh_per_second=0.5) as live:
+        # One keep-alive session is reused for every connectivity probe
+        self._session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=5),
+            connector=aiohttp.TCPConnector(limit=8, ttl_dns_cache=300, enable_cleanup_closed=True),
+        )
+        if self.metrics_path:
+            self._metrics_fp = open(self.metrics_path, 'wb', buffering=0)
+        self.docker_stats.start()
+        try:
+            await self._run_dashboard(end_time)
+        finally:
+            self.docker_stats.stop()
+            await self._session.close()
+            self._session = None
+            if self._metrics_fp is not None:
+                self._metrics_fp.close()
+                self._metrics_fp = None
+            
+    async def _run_dashboard(self, end_time: float = None):
+        """Refresh the live dashboard until the end time (if any) is reached."""
+        # Redrawn only after each tick's update, never mid-update from a refresh thread
+        with Live(console=console, auto_refresh=False) as live:
             while True:
                 if end_time and time.time() > end_time:
                     break
@@ -253,10 +672,12 @@ class SystemMonitor:
                     # Collect metrics
                     metrics = await self.collect_all_metrics()
                     self.metrics_history.append(metrics)
+                    if self._metrics_fp is not None:
+                        self._metrics_fp.write(dump_metrics_line(metrics))
                     
                     # Update dashboard
                     layout = self.create_dashboard_layout(metrics)
-                    live.update(layout)
+                    live.update(layout, refresh=True)
                     
                     # Wait for next interval
                     await asyncio.sleep(self.interval)
@@ -268,13 +689,21 @@ class SystemMonitor:
                     await asyncio.sleep(self.interval)
                     
     def save_metrics_history(self, filename: str = None):
-        """Save collected metrics to JSON file."""
+        """Save collected metrics as NDJSON (one JSON object per line).
+        
+        When metrics were already streamed during monitoring, this only reports that file.
+        """
+        if self.metrics_path and os.path.exists(self.metrics_path):
+            console.print(f"📁 Metrics saved to: {self.metrics_path}", style="green")
+            return
+            
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"system_metrics_{timestamp}.json"
+            filename = f"system_metrics_{timestamp}.jsonl"
             
-        with open(filename, 'w') as f:
-            json.dump(self.metrics_history, f, indent=2, default=str)
+        with open(filename, 'wb') as f:
+            for metrics in self.metrics_history:
+                f.write(dump_metrics_line(metrics))
             
         console.print(f"📁 Metrics saved to: {filename}", style="green")
 
@@ -283,11 +712,16 @@ async def main():
     parser = argparse.ArgumentParser(description="Temporal Platform System Monitor")
     parser.add_argument("--interval", type=int, default=5, help="Monitoring interval in seconds")
     parser.add_argument("--duration", type=int, help="Monitoring duration in seconds (unlimited if not specified)")
-    parser.add_argument("--save-metrics", action="store_true", help="Save metrics history to file")
+    parser.add_argument("--save-metrics", action="store_true", help="Stream metrics history to an NDJSON file")
     
     args = parser.parse_args()
     
-    monitor = SystemMonitor(interval=args.interval)
+    metrics_path = None
+    if args.save_metrics:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        metrics_path = f"system_metrics_{timestamp}.jsonl"
+        
+    monitor = SystemMonitor(interval=args.interval, metrics_path=metrics_path)
     
     try:
         await monitor.monitor_continuously(duration=args.duration)
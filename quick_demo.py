@@ -9,6 +9,7 @@ Demonstrates the system working with a small load test that runs immediately.
 import asyncio
 import sys
 import os
+import aiohttp
 from rich.console import Console
 from rich.panel import Panel
 
@@ -17,86 +18,117 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), 'src'
 
 console = Console()
 
-async def quick_system_test():
-    """Run a quick system demonstration."""
-    
-    console.print(Panel(
-        "🚀 **Temporal Platform Quick Demo**\n"
-        "Testing system connectivity and basic functionality",
-        title="System Demo",
-        expand=False
-    ))
-    
-    # Test 1: Basic connectivity
-    console.print("1. 🔗 Testing Temporal UI connectivity...")
-    import subprocess
+async def fetch(session: aiohttp.ClientSession, url: str, timeout: float = 5) -> tuple:
+    """GET a URL and return its status code and raw body bytes."""
+    async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+        return response.status, await response.read()
+
+async def check_temporal_ui(session: aiohttp.ClientSession) -> list:
+    """Test 1: Basic connectivity."""
+    lines = [("1. 🔗 Testing Temporal UI connectivity...", None)]
     try:
-        result = subprocess.run(['curl', '-s', 'http://localhost:8080/api/v1/cluster-info'], 
-                              capture_output=True, text=True, timeout=5)
-        if result.returncode == 0 and 'clusterId' in result.stdout:
-            console.print("   ✅ Temporal UI: Connected", style="green")
+        status, body = await fetch(session, 'http://localhost:8080/api/v1/cluster-info')
+        if status == 200 and b'clusterId' in body:
+            lines.append(("   ✅ Temporal UI: Connected", "green"))
         else:
-            console.print("   ❌ Temporal UI: Not accessible", style="red")
+            lines.append(("   ❌ Temporal UI: Not accessible", "red"))
     except:
-        console.print("   ❌ Temporal UI: Connection failed", style="red")
-    
-    # Test 2: Elasticsearch
-    console.print("2. 🔍 Testing Elasticsearch...")
+        lines.append(("   ❌ Temporal UI: Connection failed", "red"))
+    return lines
+
+async def check_elasticsearch(session: aiohttp.ClientSession) -> list:
+    """Test 2: Elasticsearch."""
+    lines = [("2. 🔍 Testing Elasticsearch...", None)]
     try:
-        result = subprocess.run(['curl', '-s', 'http://localhost:9200/_cluster/health'], 
-                              capture_output=True, text=True, timeout=5)
-        if result.returncode == 0 and ('green' in result.stdout or 'yellow' in result.stdout):
-            console.print("   ✅ Elasticsearch: Healthy", style="green")
+        status, body = await fetch(session, 'http://localhost:9200/_cluster/health')
+        if status == 200 and (b'green' in body or b'yellow' in body):
+            lines.append(("   ✅ Elasticsearch: Healthy", "green"))
         else:
-            console.print("   ❌ Elasticsearch: Not healthy", style="red")
+            lines.append(("   ❌ Elasticsearch: Not healthy", "red"))
     except:
-        console.print("   ❌ Elasticsearch: Connection failed", style="red")
-    
-    # Test 3: Docker containers
-    console.print("3. 🐳 Checking Docker containers...")
+        lines.append(("   ❌ Elasticsearch: Connection failed", "red"))
+    return lines
+
+async def check_docker_containers() -> list:
+    """Test 3: Docker containers."""
+    lines = [("3. 🐳 Checking Docker containers...", None)]
     try:
-        result = subprocess.run(['docker', 'ps', '--format', 'table {{.Names}}\t{{.Status}}'], 
-                              capture_output=True, text=True, timeout=5)
-        if result.returncode == 0:
-            lines = result.stdout.strip().split('\n')
-            temporal_containers = [line for line in lines if 'temporal' in line.lower()]
-            console.print(f"   ✅ Found {len(temporal_containers)} Temporal containers running", style="green")
+        proc = await asyncio.create_subprocess_exec(
+            'docker', 'ps', '--format', 'table {{.Names}}\t{{.Status}}',
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL
+        )
+        try:
+            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=5)
+        except asyncio.TimeoutError:
+            proc.kill()
+            raise
+        if proc.returncode == 0:
+            output = stdout.decode().strip().split('\n')
+            temporal_containers = [line for line in output if 'temporal' in line.lower()]
+            lines.append((f"   ✅ Found {len(temporal_containers)} Temporal containers running", "green"))
         else:
-            console.print("   ❌ Could not check Docker containers", style="red")
+            lines.append(("   ❌ Could not check Docker containers", "red"))
     except:
-        console.print("   ❌ Docker not accessible", style="red")
-    
-    # Test 4: Python application
-    console.print("4. 🐍 Testing Python application...")
+        lines.append(("   ❌ Docker not accessible", "red"))
+    return lines
+
+async def check_python_app() -> list:
+    """Test 4: Python application."""
+    lines = [("4. 🐍 Testing Python application...", None)]
     try:
         from temporal_platform.config.settings import Settings
         settings = Settings()
-        console.print(f"   ✅ Configuration loaded: {settings.environment}", style="green")
-        console.print(f"   ✅ Temporal host: {settings.temporal.temporal_host}:{settings.temporal.temporal_port}", style="green")
+        lines.append((f"   ✅ Configuration loaded: {settings.environment}", "green"))
+        lines.append((f"   ✅ Temporal host: {settings.temporal.temporal_host}:{settings.temporal.temporal_port}", "green"))
     except Exception as e:
-        console.print(f"   ❌ Python app error: {e}", style="red")
-    
-    # Test 5: Quick load test (basic connections)
-    console.print("5. ⚡ Running quick load test (10 connections)...")
+        lines.append((f"   ❌ Python app error: {e}", "red"))
+    return lines
+
+async def check_quick_load(session: aiohttp.ClientSession) -> list:
+    """Test 5: Quick load test (basic connections)."""
+    lines = [("5. ⚡ Running quick load test (10 connections)...", None)]
     
-    success_count = 0
     total_tests = 10
     
-    for i in range(total_tests):
-        try:
-            result = subprocess.run(['curl', '-s', '-w', '%{http_code}', 
-                                   'http://localhost:8080/api/v1/cluster-info'], 
-                                  capture_output=True, text=True, timeout=2)
-            if '200' in result.stdout:
-                success_count += 1
-        except:
-            pass
+    results = await asyncio.gather(
+        *(fetch(session, 'http://localhost:8080/api/v1/cluster-info', timeout=2) for _ in range(total_tests)),
+        return_exceptions=True
+    )
+    success_count = sum(1 for r in results if not isinstance(r, BaseException) and r[0] == 200)
     
     success_rate = (success_count / total_tests) * 100
     if success_rate >= 80:
-        console.print(f"   ✅ Load test: {success_count}/{total_tests} successful ({success_rate:.0f}%)", style="green")
+        lines.append((f"   ✅ Load test: {success_count}/{total_tests} successful ({success_rate:.0f}%)", "green"))
     else:
-        console.print(f"   ⚠️  Load test: {success_count}/{total_tests} successful ({success_rate:.0f}%)", style="yellow")
+        lines.append((f"   ⚠️  Load test: {success_count}/{total_tests} successful ({success_rate:.0f}%)", "yellow"))
+    return lines
+
+async def run_checks(session: aiohttp.ClientSession):
+    """Run the individual system checks concurrently, reporting them in order."""
+    reports = await asyncio.gather(
+        check_temporal_ui(session),
+        check_elasticsearch(session),
+        check_docker_containers(),
+        check_python_app(),
+        check_quick_load(session),
+    )
+    for lines in reports:
+        for text, style in lines:
+            console.print(text, style=style)
+
+async def quick_system_test():
+    """Run a quick system demonstration."""
+    
+    console.print(Panel(
+        "🚀 **Temporal Platform Quick Demo**\n"
+        "Testing system connectivity and basic functionality",
+        title="System Demo",
+        expand=False
+    ))
+    
+    # A single keep-alive session serves every HTTP probe below
+    async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=16)) as session:
+        await run_checks(session)
     
     # Summary
     console.print("\n" + "="*60)
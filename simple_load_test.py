@@ -14,7 +14,8 @@ import asyncio
 import time
 import sys
 import os
-from typing import List, Dict, Any
+from array import array
+from typing import Dict, Any
 from datetime import datetime, timedelta
 import argparse
 from rich.console import Console
@@ -43,7 +44,8 @@ class SimpleLoadTest:
             'submitted': 0,
             'completed': 0,
             'failed': 0,
-            'submission_times': [],
+            # Packed C doubles instead of a list of float objects
+            'submission_times': array('d'),
             'start_time': None,
             'end_time': None
         }
@@ -71,25 +73,19 @@ class SimpleLoadTest:
         }
         
         try:
-            # Simple workflow data - just basic strings to avoid complex data model issues
-            workflow_data = {
-                'id': workflow_id,
-                'data': f'Test data for workflow {workflow_id}',
-                'timestamp': datetime.now().isoformat()
-            }
-            
             # Instead of starting actual workflows that might fail due to model issues,
             # we'll test namespace and cluster operations which are simpler
-            # This still tests the Temporal connectivity and client performance
-            
-            # Test 1: List namespaces (tests connectivity)
-            await self.client.service.list_namespaces()
-            
-            # Test 2: Get cluster info (tests server response)
-            await self.client.service.get_cluster_info()
-            
-            # Test 3: Get system info (tests system connectivity)
-            await self.client.service.get_system_info()
+            # This still tests the Temporal connectivity and client performance.
+            # The three RPCs are independent, so they are multiplexed concurrently
+            # over the client's single HTTP/2 connection.
+            await asyncio.gather(
+                # Test 1: List namespaces (tests connectivity)
+                self.client.service.list_namespaces(),
+                # Test 2: Get cluster info (tests server response)
+                self.client.service.get_cluster_info(),
+                # Test 3: Get system info (tests system connectivity)
+                self.client.service.get_system_info(),
+            )
             
             submission_time = time.time() - start_time
             result.update({
@@ -107,16 +103,10 @@ class SimpleLoadTest:
             
         return result
         
-    async def run_batch(self, workflow_indices: List[int]) -> List[Dict[str, Any]]:
-        """Run a batch of workflow submissions concurrently."""
-        tasks = []
-        
-        for index in workflow_indices:
-            workflow_id = f"load-test-{index:06d}"
-            task = asyncio.create_task(self.submit_simple_workflow(workflow_id))
-            tasks.append(task)
-            
-        return await asyncio.gather(*tasks, return_exceptions=True)
+    async def run_guarded(self, semaphore: asyncio.Semaphore, index: int) -> Dict[str, Any]:
+        """Submit a workflow once a concurrency slot is available."""
+        async with semaphore:
+            return await self.submit_simple_workflow(f"load-test-{index:06d}")
         
     async def run_load_test(self):
         """Run the complete load test."""
@@ -131,13 +121,10 @@ class SimpleLoadTest:
         
         self.results['start_time'] = datetime.now()
         
-        # Create workflow batches
-        workflow_batches = []
-        for i in range(0, self.total_workflows, self.concurrent_limit):
-            batch = list(range(i, min(i + self.concurrent_limit, self.total_workflows)))
-            workflow_batches.append(batch)
+        # A semaphore keeps `concurrent_limit` submissions in flight at all times
+        semaphore = asyncio.Semaphore(self.concurrent_limit)
             
-        # Execute batches with progress tracking
+        # Execute submissions with progress tracking
         with Progress(
             TextColumn("[progress.description]{task.description}"),
             BarColumn(),
@@ -148,31 +135,26 @@ class SimpleLoadTest:
         ) as progress:
             
             overall_task = progress.add_task("Overall Progress", total=self.total_workflows)
-            batch_task = progress.add_task("Current Batch", total=len(workflow_batches))
             
-            for batch_idx, workflow_indices in enumerate(workflow_batches):
-                progress.update(batch_task, description=f"Batch {batch_idx + 1}/{len(workflow_batches)}")
-                
-                # Execute batch
-                batch_results = await self.run_batch(workflow_indices)
+            tasks = []
+            for i in range(self.total_workflows):
+                task = asyncio.create_task(self.run_guarded(semaphore, i))
+                task.add_done_callback(lambda _: progress.update(overall_task, advance=1))
+                tasks.append(task)
                 
-                # Process results
-                for result in batch_results:
-                    if isinstance(result, Exception):
-                        self.results['failed'] += 1
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            
+            # Process results
+            for result in results:
+                if isinstance(result, Exception):
+                    self.results['failed'] += 1
+                else:
+                    self.results['submitted'] += 1
+                    if result['submitted']:
+                        self.results['completed'] += 1
+                        self.results['submission_times'].append(result['submission_time'])
                     else:
-                        self.results['submitted'] += 1
-                        if result['submitted']:
-                            self.results['completed'] += 1
-                            self.results['submission_times'].append(result['submission_time'])
-                        else:
-                            self.results['failed'] += 1
-                        
-                progress.update(overall_task, advance=len(workflow_indices))
-                progress.update(batch_task, advance=1)
-                
-                # Small delay between batches
-                await asyncio.sleep(0.05)
+                        self.results['failed'] += 1
                 
         self.results['end_time'] = datetime.now()
         
@@ -182,10 +164,14 @@ class SimpleLoadTest:
         success_rate = (self.results['completed'] / self.results['submitted'] * 100) if self.results['submitted'] > 0 else 0
         
         # Calculate timing statistics
-        submission_times = self.results['submission_times']
-        avg_time = sum(submission_times) / len(submission_times) if submission_times else 0
-        min_time = min(submission_times) if submission_times else 0
-        max_time = max(submission_times) if submission_times else 0
+        submission_times = sorted(self.results['submission_times'])
+        n = len(submission_times)
+        avg_time = sum(submission_times) / n if n else 0
+        min_time = submission_times[0] if n else 0
+        max_time = submission_times[-1] if n else 0
+        p50_time = submission_times[n // 2] if n else 0
+        p95_time = submission_times[int(0.95 * n)] if n else 0
+        p99_time = submission_times[int(0.99 * n)] if n else 0
         
         # Results table
         table = Table(title="🎯 Simple Load Test Results")
@@ -202,6 +188,7 @@ class SimpleLoadTest:
         table.add_row("⏱️  Avg Response Time", f"{avg_time:.3f}s", "")
         table.add_row("⚡ Min Response Time", f"{min_time:.3f}s", "")
         table.add_row("🐌 Max Response Time", f"{max_time:.3f}s", "")
+        table.add_row("📊 P50 / P95 / P99", f"{p50_time:.3f}s / {p95_time:.3f}s / {p99_time:.3f}s", "")
         table.add_row("🕒 Total Duration", f"{total_time:.1f}s", "")
         
         console.print(table)
@@ -3,9 +3,12 @@ Data processing activities implementing async operations with retry policies.
 Demonstrates Pattern 2: Async Operations with proper timeout handling and error recovery.
 """
 import asyncio
+import hashlib
 import json
 import time
-from typing import Dict, List, Any, Optional
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Any, Optional
 from datetime import datetime, timedelta
 from temporalio import activity
 import structlog
@@ -21,6 +24,148 @@ from ..config.settings import settings
 
 logger = structlog.get_logger(__name__)
 
+# Checked once at import so per-item debug calls cost nothing when filtered out
+_DEBUG_ENABLED = settings.logging.log_level == "DEBUG"
+
+# Upper bound on items processed concurrently within one batch activity
+_MAX_CONCURRENT = settings.workflow.max_concurrent_activities
+
+# Models use ``use_enum_values``, so a result's status is the plain enum value;
+# comparing against the value skips the str-subclass dispatch of the member
+_COMPLETED = ActivityStatus.COMPLETED.value
+
+# Statistics reported when there are no batch results to validate
+_EMPTY_VALIDATION_STATS: Dict[str, Any] = {
+    "total_batches": 0,
+    "total_items": 0,
+    "successful_items": 0,
+    "failed_items": 0,
+    "success_rate_percentage": 0,
+    "total_processing_time_seconds": 0,
+    "average_batch_processing_time_seconds": 0,
+    "throughput_items_per_second": 0
+}
+
+# Items larger than this have their content transformed and hashed in a worker thread
+OFFLOAD_THRESHOLD_BYTES = 64_000
+
+# Heartbeat cadence used when the activity has no heartbeat timeout configured
+DEFAULT_HEARTBEAT_INTERVAL_SECONDS = 2.0
+
+
+class _HeartbeatThrottler:
+    """
+    Limits heartbeats to one per interval, like the Go and Java SDKs do.
+    
+    The interval is 80% of the activity's heartbeat timeout. Heartbeats requested
+    in between are not dropped: the latest details are kept and sent by a timer
+    when the interval is up, so the gap between sent heartbeats stays within the
+    interval as long as heartbeats keep being requested.
+    """
+    
+    def __init__(self) -> None:
+        heartbeat_timeout = activity.info().heartbeat_timeout
+        if heartbeat_timeout:
+            self.interval = heartbeat_timeout.total_seconds() * 0.8
+        else:
+            self.interval = DEFAULT_HEARTBEAT_INTERVAL_SECONDS
+        self.last_sent_at = float("-inf")
+        self._pending: Optional[tuple] = None
+        self._flusher: Optional[asyncio.Task] = None
+    
+    def maybe_heartbeat(self, *details: Any) -> None:
+        """Send a heartbeat now if the interval has elapsed, else when it does."""
+        now = time.monotonic()
+        if now - self.last_sent_at >= self.interval:
+            self._send(details, now)
+            return
+        self._pending = details
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(
+                self._flush_after(self.last_sent_at + self.interval - now)
+            )
+    
+    def close(self) -> None:
+        """Stop the flush timer, discarding details that have not been sent."""
+        self._pending = None
+        if self._flusher is not None:
+            self._flusher.cancel()
+            self._flusher = None
+    
+    async def _flush_after(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        self._flusher = None
+        if self._pending is not None:
+            self._send(self._pending, time.monotonic())
+    
+    def _send(self, details: tuple, now: float) -> None:
+        activity.heartbeat(*details)
+        self.last_sent_at = now
+        self._pending = None
+
+
+# Shared by a batch activity and the process_single_item calls it makes
+_heartbeat_throttler: ContextVar[Optional[_HeartbeatThrottler]] = ContextVar(
+    "_heartbeat_throttler", default=None
+)
+
+
+def _get_heartbeat_throttler() -> _HeartbeatThrottler:
+    """Return the heartbeat throttler for the current activity execution."""
+    throttler = _heartbeat_throttler.get()
+    if throttler is None:
+        throttler = _HeartbeatThrottler()
+        _heartbeat_throttler.set(throttler)
+    return throttler
+
+
+@contextmanager
+def _heartbeat_scope() -> Iterator[_HeartbeatThrottler]:
+    """
+    Use the current execution's heartbeat throttler for the duration of a block.
+    
+    A throttler created here belongs to the block and its flush timer is stopped
+    on exit, so no heartbeat is sent after the activity has finished. A throttler
+    inherited from an enclosing batch activity is left to that activity.
+    """
+    throttler = _heartbeat_throttler.get()
+    if throttler is not None:
+        yield throttler
+        return
+    
+    throttler = _HeartbeatThrottler()
+    token = _heartbeat_throttler.set(throttler)
+    try:
+        yield throttler
+    finally:
+        throttler.close()
+        _heartbeat_throttler.reset(token)
+
+
+def _sha256_hexdigest(content: str) -> str:
+    """Return the SHA-256 hex digest of UTF-8 encoded content."""
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def _simulated_delay(data_item: DataItem) -> float:
+    """Return the simulated processing time for an item."""
+    return min(data_item.size_bytes / 10000, 10)  # Max 10 seconds
+
+
+async def _sleep_with_heartbeats(
+    delay: float,
+    throttler: _HeartbeatThrottler,
+    *details: Any
+) -> None:
+    """Sleep for ``delay`` seconds, requesting a heartbeat every throttler interval."""
+    deadline = time.monotonic() + delay
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        await asyncio.sleep(min(remaining, throttler.interval))
+        throttler.maybe_heartbeat(*details)
+
 
 @activity.defn
 async def process_single_item(data_item: DataItem) -> ProcessingResult:
@@ -31,27 +176,44 @@ async def process_single_item(data_item: DataItem) -> ProcessingResult:
         data_item: The data item to process
         
     Returns:
-        ProcessingResult with processing outcome
+        ProcessingResult with processing outcome; failures are reported
+        with a FAILED or TIMEOUT status rather than raised
         
     Raises:
-        DataProcessingError: When processing fails
-        ActivityTimeoutError: When processing times out
+        ActivityTimeoutError: When processing would exceed the heartbeat timeout
+    """
+    with _heartbeat_scope():
+        return await _process_item(data_item)
+
+
+async def _process_item(
+    data_item: DataItem,
+    simulate_work: bool = True,
+    start_time: Optional[float] = None
+) -> ProcessingResult:
+    """
+    Body of process_single_item.
+    
+    Batch callers that already slept for the simulated work pass
+    ``simulate_work=False`` along with the time that sleep started.
     """
-    start_time = time.time()
+    if start_time is None:
+        start_time = time.monotonic()
+    info = activity.info()
+    log = logger.bind(item_id=data_item.id)
     
     try:
-        logger.info(
+        log.info(
             "Starting item processing",
-            item_id=data_item.id,
             content_type=data_item.content_type,
             size_bytes=data_item.size_bytes
         )
         
         # Simulate processing with configurable delay
-        processing_delay = min(data_item.size_bytes / 10000, 10)  # Max 10 seconds
+        processing_delay = _simulated_delay(data_item)
         
         # Check if we have enough time before timeout
-        remaining_time = activity.info().heartbeat_timeout
+        remaining_time = info.heartbeat_timeout
         if remaining_time and processing_delay > remaining_time.total_seconds():
             raise ActivityTimeoutError(
                 "Processing time would exceed activity timeout",
@@ -60,21 +222,42 @@ async def process_single_item(data_item: DataItem) -> ProcessingResult:
             )
         
         # Simulate async processing work
-        await asyncio.sleep(processing_delay)
+        if simulate_work:
+            await asyncio.sleep(processing_delay)
         
         # Send heartbeat to prevent timeout
-        activity.heartbeat("Processing item", data_item.id)
+        _get_heartbeat_throttler().maybe_heartbeat("Processing item", data_item.id)
+        
+        # Large items are transformed off the event loop so concurrent items keep running
+        offload = data_item.size_bytes > OFFLOAD_THRESHOLD_BYTES
         
         # Process content (example: uppercase transformation)
-        processed_content = data_item.content.upper()
+        if offload:
+            processed_content = await asyncio.to_thread(str.upper, data_item.content)
+        else:
+            processed_content = data_item.content.upper()
         
         # Validate checksum if provided
         if data_item.checksum:
-            # Simulate checksum validation
-            await asyncio.sleep(0.1)
-            logger.debug("Checksum validated", item_id=data_item.id)
+            if offload:
+                checksum = await asyncio.to_thread(_sha256_hexdigest, data_item.content)
+            else:
+                checksum = _sha256_hexdigest(data_item.content)
+            if checksum != data_item.checksum:
+                raise DataProcessingError(
+                    "Checksum mismatch",
+                    data_type="DataItem"
+                )
+            if _DEBUG_ENABLED:
+                log.debug("Checksum validated")
         
-        processing_time = time.time() - start_time
+        # ASCII text is one byte per character, so skip the UTF-8 encode
+        if processed_content.isascii():
+            processed_size = len(processed_content)
+        else:
+            processed_size = len(processed_content.encode('utf-8'))
+        
+        processing_time = time.monotonic() - start_time
         
         result = ProcessingResult(
             item_id=data_item.id,
@@ -83,15 +266,14 @@ async def process_single_item(data_item: DataItem) -> ProcessingResult:
             processing_time_seconds=processing_time,
             output_metadata={
                 "original_size": data_item.size_bytes,
-                "processed_size": len(processed_content.encode('utf-8')),
+                "processed_size": processed_size,
                 "content_type": data_item.content_type,
                 "processing_method": "uppercase_transform"
             }
         )
         
-        logger.info(
+        log.info(
             "Item processing completed",
-            item_id=data_item.id,
             processing_time_seconds=processing_time,
             status=result.status
         )
@@ -99,12 +281,11 @@ async def process_single_item(data_item: DataItem) -> ProcessingResult:
         return result
         
     except asyncio.TimeoutError as e:
-        processing_time = time.time() - start_time
+        processing_time = time.monotonic() - start_time
         error_msg = f"Item processing timed out after {processing_time:.2f} seconds"
         
-        logger.error(
+        log.error(
             error_msg,
-            item_id=data_item.id,
             processing_time_seconds=processing_time,
             error=str(e)
         )
@@ -114,33 +295,42 @@ async def process_single_item(data_item: DataItem) -> ProcessingResult:
             status=ActivityStatus.TIMEOUT,
             processing_time_seconds=processing_time,
             error_message=error_msg,
-            retry_count=activity.info().attempt
+            retry_count=info.attempt
         )
         
+    except ActivityTimeoutError:
+        # Not something a retry of this item can fix, so let the caller decide
+        raise
+        
     except Exception as e:
-        processing_time = time.time() - start_time
+        processing_time = time.monotonic() - start_time
         error_msg = f"Item processing failed: {str(e)}"
         
-        logger.error(
+        log.error(
             error_msg,
-            item_id=data_item.id,
             processing_time_seconds=processing_time,
             error=str(e),
             error_type=type(e).__name__
         )
         
-        # Raise custom exception for retry handling
-        raise DataProcessingError(
-            error_msg,
-            data_type="DataItem",
-            cause=e
+        # Report the failure in the result instead of paying for a raise/catch
+        return ProcessingResult(
+            item_id=data_item.id,
+            status=ActivityStatus.FAILED,
+            processing_time_seconds=processing_time,
+            error_message=error_msg,
+            retry_count=info.attempt
         )
 
 
 @activity.defn
 async def process_batch_sequential(data_batch: DataBatch) -> BatchProcessingResult:
     """
-    Process a batch of data items sequentially.
+    Process a batch of data items, reporting results in item order.
+    
+    Item processing is I/O bound, so the items are awaited concurrently rather
+    than one after another; each result is stored at its item's index, so
+    ``item_results`` keeps the batch order.
     
     Args:
         data_batch: The batch of data items to process
@@ -148,65 +338,78 @@ async def process_batch_sequential(data_batch: DataBatch) -> BatchProcessingResu
     Returns:
         BatchProcessingResult with batch processing outcome
     """
-    start_time = time.time()
-    item_results: List[ProcessingResult] = []
-    successful_count = 0
-    failed_count = 0
+    start_time = time.monotonic()
+    log = logger.bind(batch_id=data_batch.id)
+    batch_size = data_batch.batch_size
+    item_results: List[Optional[ProcessingResult]] = [None] * batch_size
+    completed_count = 0
     
-    logger.info(
+    log.info(
         "Starting sequential batch processing",
-        batch_id=data_batch.id,
-        batch_size=data_batch.batch_size,
+        batch_size=batch_size,
         mode=data_batch.processing_mode
     )
     
-    for i, item in enumerate(data_batch.items):
-        try:
-            # Send heartbeat with progress
-            progress = f"Processing item {i+1}/{data_batch.batch_size}"
-            activity.heartbeat(progress)
-            
-            result = await process_single_item(item)
-            item_results.append(result)
-            
-            if result.status == ActivityStatus.COMPLETED:
-                successful_count += 1
-            else:
-                failed_count += 1
+    # A fixed pool of workers pulls items from one shared iterator, so only
+    # max_concurrent coroutines exist however large the batch is
+    max_concurrent = min(_MAX_CONCURRENT, batch_size)
+    work = iter(enumerate(data_batch.items))
+    
+    async def worker() -> None:
+        """Process items from the shared iterator, storing results by index."""
+        nonlocal completed_count
+        for index, item in work:
+            try:
+                result = await process_single_item(item)
+            except Exception as e:
+                log.error(
+                    "Item processing failed in batch",
+                    item_id=item.id,
+                    error=str(e)
+                )
                 
-        except Exception as e:
-            logger.error(
-                "Item processing failed in batch",
-                batch_id=data_batch.id,
-                item_id=item.id,
-                error=str(e)
-            )
-            
-            # Create failed result
-            failed_result = ProcessingResult(
-                item_id=item.id,
-                status=ActivityStatus.FAILED,
-                processing_time_seconds=0,
-                error_message=str(e),
-                retry_count=0
-            )
-            item_results.append(failed_result)
-            failed_count += 1
+                # Create failed result
+                result = ProcessingResult(
+                    item_id=item.id,
+                    status=ActivityStatus.FAILED,
+                    processing_time_seconds=0,
+                    error_message=str(e),
+                    retry_count=0
+                )
+            item_results[index] = result
+            completed_count += 1
     
-    processing_time = time.time() - start_time
+    # Entered before the workers start so they share this activity's throttler
+    with _heartbeat_scope() as throttler:
+        pending = {asyncio.create_task(worker()) for _ in range(max_concurrent)}
+        try:
+            # Wake on completions or after a heartbeat interval without any,
+            # so progress is reported even while long items are still running
+            while pending:
+                _, pending = await asyncio.wait(
+                    pending, timeout=throttler.interval, return_when=asyncio.FIRST_COMPLETED
+                )
+                throttler.maybe_heartbeat(f"Processing item {completed_count}/{batch_size}")
+        finally:
+            # Only does anything if we were cancelled part-way through
+            for task in pending:
+                task.cancel()
+    
+    successful_count = sum(1 for r in item_results if r.status == _COMPLETED)
+    failed_count = len(item_results) - successful_count
+    processing_time = time.monotonic() - start_time
     
     batch_result = BatchProcessingResult(
         batch_id=data_batch.id,
-        total_items=data_batch.batch_size,
+        total_items=batch_size,
         successful_items=successful_count,
         failed_items=failed_count,
         processing_time_seconds=processing_time,
         item_results=item_results
     )
     
-    logger.info(
+    log.info(
         "Sequential batch processing completed",
-        batch_id=data_batch.id,
         successful_items=successful_count,
         failed_items=failed_count,
         processing_time_seconds=processing_time
@@ -226,91 +429,84 @@ async def process_batch_parallel(data_batch: DataBatch) -> BatchProcessingResult
     Returns:
         BatchProcessingResult with batch processing outcome
     """
-    start_time = time.time()
+    start_time = time.monotonic()
+    log = logger.bind(batch_id=data_batch.id)
     
-    logger.info(
+    log.info(
         "Starting parallel batch processing",
-        batch_id=data_batch.id,
         batch_size=data_batch.batch_size,
         mode=data_batch.processing_mode
     )
     
-    # Create semaphore for concurrency control
-    max_concurrent = min(settings.workflow.max_concurrent_activities, data_batch.batch_size)
-    semaphore = asyncio.Semaphore(max_concurrent)
-    
-    async def process_with_semaphore(item: DataItem) -> ProcessingResult:
-        """Process item with semaphore for concurrency control."""
-        async with semaphore:
-            try:
-                return await process_single_item(item)
-            except Exception as e:
-                logger.error(
-                    "Item processing failed in parallel batch",
-                    batch_id=data_batch.id,
-                    item_id=item.id,
-                    error=str(e)
-                )
-                
-                return ProcessingResult(
-                    item_id=item.id,
-                    status=ActivityStatus.FAILED,
-                    processing_time_seconds=0,
-                    error_message=str(e),
-                    retry_count=0
-                )
-    
-    # Process all items in parallel
-    tasks = [process_with_semaphore(item) for item in data_batch.items]
+    max_concurrent = min(_MAX_CONCURRENT, data_batch.batch_size)
     
-    # Send periodic heartbeats while waiting
-    async def heartbeat_sender():
-        """Send periodic heartbeats during parallel processing."""
-        while not all(task.done() for task in tasks):
-            completed = sum(1 for task in tasks if task.done())
-            progress = f"Processing {completed}/{len(tasks)} items"
-            activity.heartbeat(progress)
-            await asyncio.sleep(2)  # Heartbeat every 2 seconds
-    
-    # Start heartbeat sender
-    heartbeat_task = asyncio.create_task(heartbeat_sender())
+    async def process_item(item: DataItem, **kwargs: Any) -> ProcessingResult:
+        """Process item, converting failures into a failed result."""
+        try:
+            return await _process_item(item, **kwargs)
+        except Exception as e:
+            log.error(
+                "Item processing failed in parallel batch",
+                item_id=item.id,
+                error=str(e)
+            )
+            
+            return ProcessingResult(
+                item_id=item.id,
+                status=ActivityStatus.FAILED,
+                processing_time_seconds=0,
+                error_message=str(e),
+                retry_count=0
+            )
     
-    try:
-        # Wait for all processing to complete
-        item_results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Handle any exceptions from gather
-        processed_results = []
-        for i, result in enumerate(item_results):
-            if isinstance(result, Exception):
-                logger.error(
-                    "Task failed with exception",
-                    batch_id=data_batch.id,
-                    item_index=i,
-                    error=str(result)
+    with _heartbeat_scope() as throttler:
+        if len(data_batch.items) == 1:
+            # A single item needs no semaphore, tasks or progress tracking
+            processed_results: List[Optional[ProcessingResult]] = [
+                await process_item(data_batch.items[0])
+            ]
+        else:
+            items = data_batch.items
+            processed_results = [None] * len(items)
+            
+            # Items run in waves of up to max_concurrent with similar simulated delays;
+            # each wave sleeps once for its longest delay instead of once per item
+            order = sorted(range(len(items)), key=lambda i: _simulated_delay(items[i]))
+            
+            # Items that cannot finish within the heartbeat timeout fail fast in
+            # _process_item's own check, before any wave is slept on
+            heartbeat_timeout = activity.info().heartbeat_timeout
+            if heartbeat_timeout:
+                limit = heartbeat_timeout.total_seconds()
+                runnable = [i for i in order if _simulated_delay(items[i]) <= limit]
+                too_slow = order[len(runnable):]
+                too_slow_results = await asyncio.gather(*(
+                    process_item(items[i], simulate_work=False) for i in too_slow
+                ))
+                for i, result in zip(too_slow, too_slow_results):
+                    processed_results[i] = result
+                order = runnable
+            
+            for wave_start in range(0, len(order), max_concurrent):
+                wave = order[wave_start:wave_start + max_concurrent]
+                progress = f"Processing {wave_start}/{len(items)} items"
+                throttler.maybe_heartbeat(progress)
+                
+                started_at = time.monotonic()
+                await _sleep_with_heartbeats(
+                    max(_simulated_delay(items[i]) for i in wave), throttler, progress
                 )
-                processed_results.append(ProcessingResult(
-                    item_id=data_batch.items[i].id,
-                    status=ActivityStatus.FAILED,
-                    processing_time_seconds=0,
-                    error_message=str(result),
-                    retry_count=0
+                wave_results = await asyncio.gather(*(
+                    process_item(items[i], simulate_work=False, start_time=started_at)
+                    for i in wave
                 ))
-            else:
-                processed_results.append(result)
-        
-    finally:
-        # Cancel heartbeat sender
-        heartbeat_task.cancel()
-        try:
-            await heartbeat_task
-        except asyncio.CancelledError:
-            pass
+                for i, result in zip(wave, wave_results):
+                    processed_results[i] = result
     
     # Calculate results
-    successful_count = sum(1 for r in processed_results if r.status == ActivityStatus.COMPLETED)
+    successful_count = sum(1 for r in processed_results if r.status == _COMPLETED)
     failed_count = len(processed_results) - successful_count
-    processing_time = time.time() - start_time
+    processing_time = time.monotonic() - start_time
     
     batch_result = BatchProcessingResult(
         batch_id=data_batch.id,
@@ -321,9 +517,8 @@ async def process_batch_parallel(data_batch: DataBatch) -> BatchProcessingResult
         item_results=processed_results
     )
     
-    logger.info(
+    log.info(
         "Parallel batch processing completed",
-        batch_id=data_batch.id,
         successful_items=successful_count,
         failed_items=failed_count,
         processing_time_seconds=processing_time,
@@ -346,49 +541,60 @@ async def validate_processing_results(
     Returns:
         Dictionary with validation results and aggregated statistics
     """
-    start_time = time.time()
+    start_time = time.monotonic()
     
     logger.info(
         "Starting batch results validation",
         batch_count=len(batch_results)
     )
     
-    total_items = sum(batch.total_items for batch in batch_results)
-    total_successful = sum(batch.successful_items for batch in batch_results)
-    total_failed = sum(batch.failed_items for batch in batch_results)
-    total_processing_time = sum(batch.processing_time_seconds for batch in batch_results)
+    if not batch_results:
+        return {
+            "validation_successful": True,
+            "validation_errors": [],
+            "validation_time_seconds": 0.0,
+            "statistics": dict(_EMPTY_VALIDATION_STATS)
+        }
+    
+    total_items = 0
+    total_successful = 0
+    total_failed = 0
+    total_processing_time = 0.0
     
-    # Validate consistency
+    # Aggregate totals and validate consistency in a single pass
     validation_errors = []
+    completed = _COMPLETED
     
     for batch in batch_results:
+        total_items += batch.total_items
+        total_successful += batch.successful_items
+        total_failed += batch.failed_items
+        total_processing_time += batch.processing_time_seconds
+        
+        item_results = batch.item_results
+        
         # Check if items count matches
-        if batch.total_items != len(batch.item_results):
+        if batch.total_items != len(item_results):
             validation_errors.append(
                 f"Batch {batch.batch_id}: item count mismatch"
             )
         
         # Check if success/failure counts match
-        actual_successful = sum(
-            1 for r in batch.item_results 
-            if r.status == ActivityStatus.COMPLETED
-        )
+        actual_successful = 0
+        for r in item_results:
+            if r.status == completed:
+                actual_successful += 1
         if actual_successful != batch.successful_items:
             validation_errors.append(
                 f"Batch {batch.batch_id}: successful count mismatch"
             )
     
     # Calculate statistics
-    avg_processing_time = total_processing_time / len(batch_results) if batch_results else 0
-    success_rate = (total_successful / total_items * 100) if total_items > 0 else 0
-    
-    # Calculate throughput
-    if total_processing_time > 0:
-        throughput = total_items / total_processing_time
-    else:
-        throughput = 0
+    avg_processing_time = total_processing_time / len(batch_results)
+    success_rate = total_successful * 100 / total_items if total_items else 0
+    throughput = total_items / total_processing_time if total_processing_time else 0
     
-    validation_time = time.time() - start_time
+    validation_time = time.monotonic() - start_time
     
     results = {
         "validation_successful": len(validation_errors) == 0,
@@ -3,12 +3,21 @@ Long-running operations activities implementing Pattern 4.
 Demonstrates heartbeat reporting and progress monitoring for large dataset processing.
 """
 import asyncio
+import random
 import time
-from typing import Dict, List, Any, Optional
+from collections import deque
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable, Deque, Dict, List, Any, Optional, Sequence, Tuple
 from datetime import datetime, timedelta
 from temporalio import activity
 import structlog
 
+try:
+    import psutil
+except ImportError:  # optional: monitor_system_resources falls back to mock metrics
+    psutil = None
+
 from ..models.workflows import (
     LongRunningOperationInput, LongRunningOperationOutput, ProgressUpdate,
     ActivityStatus
@@ -20,6 +29,31 @@ from ..config.settings import settings
 
 logger = structlog.get_logger(__name__)
 
+# Checked once at import so per-batch debug calls cost nothing when filtered out
+_DEBUG_ENABLED = settings.logging.log_level == "DEBUG"
+
+# Randomness and failure messages for the simulated batch work
+_RNG = random.Random()
+_ERROR_TYPES = (
+    "Network timeout",
+    "Memory allocation failed",
+    "Database connection lost",
+    "Invalid data format",
+    "Resource temporarily unavailable"
+)
+
+# Progress updates kept in memory and returned with the operation output
+MAX_PROGRESS_HISTORY = 256
+
+# Host resource snapshot shared by monitor_system_resources calls, refreshed in
+# the background so the activity never waits on a CPU sampling window
+RESOURCE_REFRESH_INTERVAL_SECONDS = 5.0
+_resource_cache: Optional[Dict[str, Any]] = None
+_resource_refresher: Optional[asyncio.Task] = None
+# Held while the first snapshot is taken so concurrent calls start one refresher
+_resource_init_lock = asyncio.Lock()
+_GB_INV = 1.0 / (1024 ** 3)
+
 
 @activity.defn
 async def process_large_dataset(
@@ -40,141 +74,185 @@ async def process_large_dataset(
         ActivityTimeoutError: When operation times out
         InsufficientResourcesError: When system resources are insufficient
     """
-    start_time = time.time()
-    progress_history: List[ProgressUpdate] = []
+    # Counters shared with the heartbeater and the background reporter
+    state = _ProgressState()
+    heartbeater = None
+    heartbeat = None
+    if operation_input.enable_heartbeat:
+        heartbeater = ThrottledHeartbeater(operation_input.heartbeat_interval_seconds)
+        heartbeat = partial(_record_heartbeat, heartbeater, (state,))
+    
+    try:
+        return await _process_dataset(operation_input, state, heartbeat)
+    finally:
+        if heartbeater is not None:
+            await heartbeater.flush_on_exit()
+
+
+@activity.defn
+async def process_large_dataset_batch(
+    operation_inputs: List[LongRunningOperationInput]
+) -> List[LongRunningOperationOutput]:
+    """
+    Process several long-running operations in one activity.
+    
+    Intended for many small operations, where per-activity overhead dominates.
+    The operations run concurrently and share a single heartbeat, whose details
+    are the (completed_units, failed_units) totals across the whole batch.
+    
+    Args:
+        operation_inputs: Configurations for the operations to run
+        
+    Returns:
+        LongRunningOperationOutput for each operation, in input order
+    """
+    states = [_ProgressState() for _ in operation_inputs]
+    heartbeat_intervals = [
+        operation_input.heartbeat_interval_seconds
+        for operation_input in operation_inputs
+        if operation_input.enable_heartbeat
+    ]
+    heartbeater = None
+    heartbeat = None
+    if heartbeat_intervals:
+        heartbeater = ThrottledHeartbeater(min(heartbeat_intervals))
+        heartbeat = partial(_record_heartbeat, heartbeater, states)
     
     logger.info(
-        "Starting large dataset processing",
+        "Starting batched large dataset processing",
+        operation_count=len(operation_inputs)
+    )
+    
+    try:
+        outputs = await asyncio.gather(*(
+            _process_dataset(
+                operation_input,
+                state,
+                heartbeat if operation_input.enable_heartbeat else None
+            )
+            for operation_input, state in zip(operation_inputs, states)
+        ))
+    finally:
+        if heartbeater is not None:
+            await heartbeater.flush_on_exit()
+    
+    return list(outputs)
+
+
+async def _process_dataset(
+    operation_input: LongRunningOperationInput,
+    state: "_ProgressState",
+    heartbeat: Optional[Callable[[], None]]
+) -> LongRunningOperationOutput:
+    """
+    Run one long-running operation, recording progress into ``state``.
+    
+    Args:
+        operation_input: Configuration for the long-running operation
+        state: Counters updated as batches complete
+        heartbeat: Called after every batch to record a heartbeat, if enabled
+        
+    Returns:
+        LongRunningOperationOutput with final results and progress history
+    """
+    start_ns = time.monotonic_ns()
+    # Only the most recent updates are kept (and returned) on very long runs;
+    # entries are _ProgressEntry tuples until the output is built
+    progress_history: Deque[_ProgressEntry] = deque(maxlen=MAX_PROGRESS_HISTORY)
+    
+    log = logger.bind(
         operation_id=operation_input.id,
         operation_type=operation_input.operation_type,
-        total_work_units=operation_input.total_work_units,
+        total_work_units=operation_input.total_work_units
+    )
+    log.info(
+        "Starting large dataset processing",
         work_unit_size=operation_input.work_unit_size
     )
     
     try:
-        # Initialize progress tracking
-        completed_units = 0
-        failed_units = 0
-        last_progress_update = time.time()
-        last_heartbeat = time.time()
+        # Settings read on every batch, resolved once off the Pydantic model
+        ctx = _OpCtx.from_input(operation_input)
         
         # Calculate work unit batches
         work_units_per_batch = min(operation_input.work_unit_size, 1000)
-        total_batches = (operation_input.total_work_units + work_units_per_batch - 1) // work_units_per_batch
+        full_batches, remainder = divmod(ctx.total_work_units, work_units_per_batch)
+        # Sizes are fixed up front so a failed batch doesn't shift the ones after it
+        batch_sizes = [work_units_per_batch] * full_batches + ([remainder] if remainder else [])
+        total_batches = len(batch_sizes)
         
-        logger.info(
+        log.info(
             "Dataset processing configuration",
-            operation_id=operation_input.id,
             work_units_per_batch=work_units_per_batch,
             total_batches=total_batches
         )
         
-        # Process work units in batches
-        for batch_idx in range(total_batches):
-            batch_start_time = time.time()
-            
-            # Calculate work units in this batch
-            units_in_batch = min(
-                work_units_per_batch,
-                operation_input.total_work_units - completed_units
-            )
-            
-            logger.debug(
-                "Processing batch",
-                operation_id=operation_input.id,
-                batch_idx=batch_idx + 1,
-                total_batches=total_batches,
-                units_in_batch=units_in_batch
-            )
-            
-            # Simulate batch processing
-            try:
-                await _process_work_unit_batch(
-                    operation_input, 
-                    units_in_batch, 
-                    batch_idx
-                )
-                completed_units += units_in_batch
-                
-            except Exception as e:
-                logger.error(
-                    "Batch processing failed",
-                    operation_id=operation_input.id,
-                    batch_idx=batch_idx + 1,
-                    error=str(e)
-                )
-                failed_units += units_in_batch
-                # Continue processing other batches
-            
-            current_time = time.time()
-            elapsed_time = current_time - start_time
-            
-            # Send heartbeat if enabled and interval reached
-            if (operation_input.enable_heartbeat and 
-                current_time - last_heartbeat >= operation_input.heartbeat_interval_seconds):
-                
-                progress_msg = (
-                    f"Processed {completed_units}/{operation_input.total_work_units} "
-                    f"work units ({failed_units} failed)"
-                )
-                activity.heartbeat(progress_msg)
-                last_heartbeat = current_time
-                
-                logger.debug(
-                    "Heartbeat sent",
-                    operation_id=operation_input.id,
-                    completed_units=completed_units,
-                    failed_units=failed_units
+        # The heartbeat timeout is fixed for the whole activity, so check it once
+        heartbeat_timeout = activity.info().heartbeat_timeout
+        if heartbeat_timeout:
+            remaining_timeout = heartbeat_timeout.total_seconds()
+            if remaining_timeout < ctx.heartbeat_interval_seconds:
+                log.warning(
+                    "Approaching activity timeout",
+                    remaining_timeout_seconds=remaining_timeout
                 )
+        
+        # Heartbeats and progress updates are emitted on their own timers, so
+        # the batch loop below only has to bump counters and record details
+        reporter = None
+        if ctx.enable_progress_updates:
+            reporter = asyncio.create_task(_report_progress(
+                ctx, state, progress_history, start_ns, total_batches
+            ))
+        
+        try:
+            if heartbeat is not None:
+                heartbeat()
             
-            # Send progress update if enabled and interval reached
-            if (operation_input.enable_progress_updates and 
-                current_time - last_progress_update >= operation_input.progress_update_interval_seconds):
-                
-                # Calculate progress metrics
-                progress_percentage = (completed_units / operation_input.total_work_units) * 100
-                throughput = completed_units / elapsed_time if elapsed_time > 0 else 0
-                
-                # Estimate remaining time
-                remaining_units = operation_input.total_work_units - completed_units
-                eta_seconds = remaining_units / throughput if throughput > 0 else None
+            # Process work units in batches
+            for batch_idx, units_in_batch in enumerate(batch_sizes):
+                if _DEBUG_ENABLED:
+                    log.debug(
+                        "Processing batch",
+                        batch_idx=batch_idx + 1,
+                        total_batches=total_batches,
+                        units_in_batch=units_in_batch
+                    )
                 
-                progress_update = ProgressUpdate(
-                    operation_id=operation_input.id,
-                    completed_work_units=completed_units,
-                    total_work_units=operation_input.total_work_units,
-                    progress_percentage=progress_percentage,
-                    estimated_remaining_seconds=eta_seconds,
-                    current_stage=f"Batch {batch_idx + 1}/{total_batches}",
-                    throughput_units_per_second=throughput
-                )
+                # Simulate batch processing
+                try:
+                    await _process_work_unit_batch(
+                        units_in_batch, batch_idx, ctx.complexity_factor
+                    )
+                    state.completed_units += units_in_batch
+                    
+                except Exception as e:
+                    log.error(
+                        "Batch processing failed",
+                        batch_idx=batch_idx + 1,
+                        error=str(e)
+                    )
+                    state.failed_units += units_in_batch
+                    # Continue processing other batches
                 
-                progress_history.append(progress_update)
-                last_progress_update = current_time
+                state.batches_done = batch_idx + 1
                 
-                logger.info(
-                    "Progress update",
-                    operation_id=operation_input.id,
-                    progress_percentage=progress_percentage,
-                    completed_units=completed_units,
-                    throughput=throughput,
-                    eta_seconds=eta_seconds
-                )
-            
-            # Check for activity timeout
-            activity_info = activity.info()
-            if activity_info.heartbeat_timeout:
-                remaining_timeout = activity_info.heartbeat_timeout.total_seconds()
-                if remaining_timeout < operation_input.heartbeat_interval_seconds:
-                    logger.warning(
-                        "Approaching activity timeout",
-                        operation_id=operation_input.id,
-                        remaining_timeout_seconds=remaining_timeout
-                    )
+                if heartbeat is not None:
+                    heartbeat()
+        finally:
+            if reporter is not None:
+                reporter.cancel()
+                try:
+                    await reporter
+                except asyncio.CancelledError:
+                    pass
+        
+        completed_units = state.completed_units
+        failed_units = state.failed_units
         
         # Final processing statistics
-        total_processing_time = time.time() - start_time
-        average_throughput = completed_units / total_processing_time if total_processing_time > 0 else 0
+        total_processing_time = (time.monotonic_ns() - start_ns) / 1e9
+        average_throughput, _ = _throughput_and_eta(completed_units, 0, total_processing_time)
         
         # Determine final status
         if failed_units == 0:
@@ -190,16 +268,13 @@ async def process_large_dataset(
                 "total_batches_processed": total_batches,
                 "successful_units": completed_units,
                 "failed_units": failed_units,
-                "success_rate": (completed_units / operation_input.total_work_units) * 100,
+                "success_rate": (completed_units / ctx.total_work_units) * 100,
                 "average_batch_time_seconds": total_processing_time / total_batches,
             },
             "performance_metrics": {
                 "total_processing_time_seconds": total_processing_time,
                 "average_throughput_units_per_second": average_throughput,
-                "peak_throughput_units_per_second": max(
-                    (p.throughput_units_per_second for p in progress_history), 
-                    default=0
-                ),
+                "peak_throughput_units_per_second": state.peak_throughput,
             },
             "operation_metadata": operation_input.parameters
         }
@@ -214,12 +289,13 @@ async def process_large_dataset(
             execution_time_seconds=total_processing_time,
             average_throughput=average_throughput,
             final_result=final_result,
-            progress_history=progress_history
+            progress_history=_progress_updates(
+                ctx.operation_id, ctx.total_work_units, progress_history
+            )
         )
         
-        logger.info(
+        log.info(
             "Large dataset processing completed",
-            operation_id=operation_input.id,
             status=final_status,
             completed_units=completed_units,
             failed_units=failed_units,
@@ -230,12 +306,11 @@ async def process_large_dataset(
         return output
         
     except Exception as e:
-        processing_time = time.time() - start_time
+        processing_time = (time.monotonic_ns() - start_ns) / 1e9
         error_msg = f"Large dataset processing failed: {str(e)}"
         
-        logger.error(
+        log.error(
             error_msg,
-            operation_id=operation_input.id,
             processing_time_seconds=processing_time,
             error=str(e),
             error_type=type(e).__name__
@@ -247,68 +322,354 @@ async def process_large_dataset(
             operation_type=operation_input.operation_type,
             status=ActivityStatus.FAILED,
             total_work_units=operation_input.total_work_units,
-            completed_work_units=completed_units if 'completed_units' in locals() else 0,
+            completed_work_units=state.completed_units,
             failed_work_units=operation_input.total_work_units,
             execution_time_seconds=processing_time,
             average_throughput=0,
             final_result={"error": error_msg, "error_type": type(e).__name__},
-            progress_history=progress_history if 'progress_history' in locals() else []
+            progress_history=_progress_updates(
+                operation_input.id, operation_input.total_work_units, progress_history
+            )
         )
         
         return output
 
 
+@dataclass(slots=True, frozen=True)
+class _OpCtx:
+    """Plain-attribute view of the operation settings used inside the batch loop."""
+    
+    operation_id: str
+    total_work_units: int
+    enable_heartbeat: bool
+    heartbeat_interval_seconds: int
+    enable_progress_updates: bool
+    progress_update_interval_seconds: int
+    complexity_factor: float
+    
+    @classmethod
+    def from_input(cls, operation_input: LongRunningOperationInput) -> "_OpCtx":
+        return cls(
+            operation_id=operation_input.id,
+            total_work_units=operation_input.total_work_units,
+            enable_heartbeat=operation_input.enable_heartbeat,
+            heartbeat_interval_seconds=operation_input.heartbeat_interval_seconds,
+            enable_progress_updates=operation_input.enable_progress_updates,
+            progress_update_interval_seconds=operation_input.progress_update_interval_seconds,
+            complexity_factor=float(operation_input.parameters.get("complexity_factor", 1.0)),
+        )
+
+
+@dataclass
+class _ProgressState:
+    """Progress counters updated by the batch loop and read by the reporter."""
+    
+    completed_units: int = 0
+    failed_units: int = 0
+    batches_done: int = 0
+    # Tracked as updates are recorded, since old ones drop out of the history
+    peak_throughput: float = 0
+
+
+class ThrottledHeartbeater:
+    """
+    Rate-limit activity heartbeats to one per interval.
+    
+    The first recorded payload is sent immediately; after that only the latest
+    payload is sent on each tick of a background timer, so callers can record
+    as often as they like. The latest payload is re-sent on ticks with nothing
+    new, which keeps the activity alive through long batches.
+    """
+    
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._pending: Optional[tuple] = None
+        self._last: Optional[tuple] = None
+        self._timer: Optional[asyncio.Task] = None
+    
+    def record(self, *details: Any) -> None:
+        """Record heartbeat details, sending them now if this is the first call."""
+        if self._timer is None:
+            self._send(details)
+            self._timer = asyncio.create_task(self._run())
+        else:
+            self._pending = details
+    
+    async def flush_on_exit(self) -> None:
+        """Stop the timer, discarding any payload that has not been sent yet."""
+        self._pending = None
+        if self._timer is not None:
+            self._timer.cancel()
+            try:
+                await self._timer
+            except asyncio.CancelledError:
+                pass
+            self._timer = None
+    
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            details = self._pending if self._pending is not None else self._last
+            self._pending = None
+            self._send(details)
+    
+    def _send(self, details: tuple) -> None:
+        activity.heartbeat(*details)
+        self._last = details
+        if _DEBUG_ENABLED:
+            logger.debug("Heartbeat sent", details=details)
+
+
+# (completed_units, progress_percentage, eta_seconds, stage, throughput)
+_ProgressEntry = Tuple[int, float, Optional[float], str, float]
+
+
+def _progress_updates(
+    operation_id: str,
+    total_work_units: int,
+    progress_history: Deque[_ProgressEntry]
+) -> List[ProgressUpdate]:
+    """Build the ProgressUpdate models for recorded progress entries."""
+    return [
+        ProgressUpdate(
+            operation_id=operation_id,
+            completed_work_units=completed_units,
+            total_work_units=total_work_units,
+            progress_percentage=progress_percentage,
+            estimated_remaining_seconds=eta_seconds,
+            current_stage=stage,
+            throughput_units_per_second=throughput
+        )
+        for completed_units, progress_percentage, eta_seconds, stage, throughput
+        in progress_history
+    ]
+
+
+def _throughput_and_eta(
+    completed_units: int,
+    remaining_units: int,
+    elapsed_seconds: float
+) -> Tuple[float, Optional[float]]:
+    """
+    Compute throughput in units per second and the estimated seconds remaining.
+    
+    Elapsed time is clamped to a nanosecond so the division never needs a guard;
+    the ETA is None until some units have completed.
+    """
+    throughput = completed_units / max(elapsed_seconds, 1e-9)
+    eta_seconds = remaining_units / throughput if completed_units else None
+    return throughput, eta_seconds
+
+
+def _record_heartbeat(
+    heartbeater: ThrottledHeartbeater,
+    states: Sequence[_ProgressState]
+) -> None:
+    """Record (completed_units, failed_units) heartbeat details for the given operations."""
+    if len(states) == 1:
+        heartbeater.record(states[0].completed_units, states[0].failed_units)
+    else:
+        heartbeater.record(
+            sum(state.completed_units for state in states),
+            sum(state.failed_units for state in states)
+        )
+
+
+async def _report_progress(
+    ctx: _OpCtx,
+    state: _ProgressState,
+    progress_history: Deque[_ProgressEntry],
+    start_ns: int,
+    total_batches: int
+) -> None:
+    """
+    Record progress updates on the configured interval.
+    
+    Runs as a background task alongside the batch loop and always reports the
+    latest counters, however fast batches complete. Runs until cancelled.
+    
+    Args:
+        ctx: Operation settings
+        state: Counters shared with the batch loop
+        progress_history: Ring buffer that progress updates are appended to
+        start_ns: Operation start time from ``time.monotonic_ns()``
+        total_batches: Total number of batches in the operation
+    """
+    total_units = ctx.total_work_units
+    progress_interval_ns = ctx.progress_update_interval_seconds * 1_000_000_000
+    
+    # Deadline in integer nanoseconds
+    now_ns = time.monotonic_ns()
+    next_progress_ns = now_ns + progress_interval_ns
+    
+    while True:
+        await asyncio.sleep((next_progress_ns - now_ns) / 1e9)
+        now_ns = time.monotonic_ns()
+        completed_units = state.completed_units
+        
+        # Send progress update if interval reached
+        if now_ns >= next_progress_ns:
+            elapsed_time = (now_ns - start_ns) / 1e9
+            
+            # Calculate progress metrics
+            progress_percentage = (completed_units / total_units) * 100
+            throughput, eta_seconds = _throughput_and_eta(
+                completed_units, total_units - completed_units, elapsed_time
+            )
+            
+            progress_history.append((
+                completed_units,
+                progress_percentage,
+                eta_seconds,
+                f"Batch {state.batches_done}/{total_batches}",
+                throughput
+            ))
+            if throughput > state.peak_throughput:
+                state.peak_throughput = throughput
+            next_progress_ns = now_ns + progress_interval_ns
+            
+            logger.info(
+                "Progress update",
+                operation_id=ctx.operation_id,
+                progress_percentage=progress_percentage,
+                completed_units=completed_units,
+                throughput=throughput,
+                eta_seconds=eta_seconds
+            )
+
+
 async def _process_work_unit_batch(
-    operation_input: LongRunningOperationInput,
     units_in_batch: int,
-    batch_idx: int
+    batch_idx: int,
+    complexity_factor: float
 ) -> None:
     """
     Process a batch of work units with simulated work and error injection.
     
     Args:
-        operation_input: Operation configuration
         units_in_batch: Number of units in this batch
         batch_idx: Index of the current batch
+        complexity_factor: Multiplier applied to the simulated processing time
         
     Raises:
         Exception: Simulated processing errors
     """
     # Simulate processing time based on work unit size and complexity
     base_processing_time = 0.1  # Base time per unit
-    complexity_factor = operation_input.parameters.get("complexity_factor", 1.0)
     processing_time = base_processing_time * units_in_batch * complexity_factor
     
     # Add some randomness to simulate real-world variability
-    import random
-    processing_time *= random.uniform(0.8, 1.2)
+    processing_time *= _RNG.uniform(0.8, 1.2)
     
     # Simulate occasional failures (5% failure rate)
-    if random.random() < 0.05:
-        error_types = [
-            "Network timeout",
-            "Memory allocation failed",
-            "Database connection lost",
-            "Invalid data format",
-            "Resource temporarily unavailable"
-        ]
-        raise Exception(f"Batch processing failed: {random.choice(error_types)}")
+    if _RNG.random() < 0.05:
+        raise Exception(f"Batch processing failed: {_RNG.choice(_ERROR_TYPES)}")
     
-    # Simulate CPU-intensive work with periodic yielding
-    chunk_size = 0.5  # Process in 0.5 second chunks
-    chunks = int(processing_time / chunk_size)
+    # Simulate the work as one timed wait; heartbeats come from the
+    # heartbeater's timer, so there is no need to wake up part-way through
+    await asyncio.sleep(processing_time)
+
+
+def _collect_resource_metrics(cpu_count: Optional[int]) -> Dict[str, Any]:
+    """
+    Take a snapshot of host resource usage without blocking.
     
-    for i in range(chunks):
-        await asyncio.sleep(chunk_size)
-        
-        # Yield control periodically
-        if i % 5 == 0:
-            await asyncio.sleep(0)
+    The core count never changes while the worker runs, so it is read once by
+    the caller and passed in rather than queried on every refresh.
+    """
+    # Get CPU utilization since the previous snapshot
+    cpu_percent = psutil.cpu_percent(interval=None)
     
-    # Handle remaining time
-    remaining_time = processing_time - (chunks * chunk_size)
-    if remaining_time > 0:
-        await asyncio.sleep(remaining_time)
+    # Get memory utilization  
+    memory = psutil.virtual_memory()
+    memory_percent = memory.percent
+    memory_available_gb = memory.available * _GB_INV
+    
+    # Get disk utilization
+    disk = psutil.disk_usage('/')
+    disk_percent = disk.percent
+    disk_free_gb = disk.free * _GB_INV
+    
+    # Get network I/O
+    network = psutil.net_io_counters()
+    
+    return {
+        "timestamp": datetime.utcnow().isoformat(),
+        "cpu": {
+            "utilization_percent": cpu_percent,
+            "core_count": cpu_count,
+            "load_average": psutil.getloadavg() if hasattr(psutil, 'getloadavg') else None
+        },
+        "memory": {
+            "utilization_percent": memory_percent,
+            "total_gb": memory.total * _GB_INV,
+            "available_gb": memory_available_gb,
+            "used_gb": memory.used * _GB_INV
+        },
+        "disk": {
+            "utilization_percent": disk_percent,
+            "total_gb": disk.total * _GB_INV,
+            "free_gb": disk_free_gb,
+            "used_gb": disk.used * _GB_INV
+        },
+        "network": {
+            "bytes_sent": network.bytes_sent,
+            "bytes_received": network.bytes_recv,
+            "packets_sent": network.packets_sent,
+            "packets_received": network.packets_recv
+        }
+    }
+
+
+async def _refresh_resource_metrics(cpu_count: Optional[int], interval: float) -> None:
+    """Keep the shared resource snapshot fresh for monitor_system_resources."""
+    global _resource_cache
+    while True:
+        await asyncio.sleep(interval)
+        # psutil reads /proc synchronously, so keep it off the event loop
+        _resource_cache = await asyncio.to_thread(_collect_resource_metrics, cpu_count)
+
+
+async def close_resource_refresher() -> None:
+    """Stop the background resource refresher; called on worker shutdown."""
+    global _resource_refresher
+    if _resource_refresher is not None:
+        _resource_refresher.cancel()
+        try:
+            await _resource_refresher
+        except asyncio.CancelledError:
+            pass
+        _resource_refresher = None
+
+
+def _mock_resource_metrics(start_time: float) -> Dict[str, Any]:
+    """Return fixed resource metrics for hosts without psutil."""
+    # Fallback when psutil is not available
+    logger.warning("psutil not available, using mock resource metrics")
+    
+    return {
+        "timestamp": datetime.utcnow().isoformat(),
+        "monitoring_time_seconds": time.time() - start_time,
+        "cpu": {"utilization_percent": 50.0, "core_count": 4},
+        "memory": {
+            "utilization_percent": 60.0,
+            "total_gb": 16.0,
+            "available_gb": 6.4,
+            "used_gb": 9.6
+        },
+        "disk": {
+            "utilization_percent": 70.0,
+            "total_gb": 500.0,
+            "free_gb": 150.0,
+            "used_gb": 350.0
+        },
+        "network": {
+            "bytes_sent": 1024*1024*100,  # 100 MB
+            "bytes_received": 1024*1024*200,  # 200 MB
+            "packets_sent": 10000,
+            "packets_received": 15000
+        }
+    }
 
 
 @activity.defn
@@ -320,96 +681,43 @@ async def monitor_system_resources() -> Dict[str, Any]:
     Returns:
         Dictionary with system resource metrics
     """
+    global _resource_cache, _resource_refresher
     start_time = time.time()
     
     try:
-        import psutil
-        
-        # Get CPU utilization
-        cpu_percent = psutil.cpu_percent(interval=1)
-        cpu_count = psutil.cpu_count()
-        
-        # Get memory utilization  
-        memory = psutil.virtual_memory()
-        memory_percent = memory.percent
-        memory_available_gb = memory.available / (1024**3)
-        
-        # Get disk utilization
-        disk = psutil.disk_usage('/')
-        disk_percent = disk.percent
-        disk_free_gb = disk.free / (1024**3)
-        
-        # Get network I/O
-        network = psutil.net_io_counters()
+        if psutil is None:
+            return _mock_resource_metrics(start_time)
+        
+        if _resource_refresher is None or _resource_refresher.done():
+            async with _resource_init_lock:
+                # Another call may have started the refresher while we waited
+                if _resource_refresher is None or _resource_refresher.done():
+                    # The first non-blocking CPU reading only sets the baseline, so
+                    # wait (without blocking the loop) for a meaningful first sample
+                    await asyncio.to_thread(psutil.cpu_percent, None)
+                    await asyncio.sleep(1)
+                    cpu_count = psutil.cpu_count()
+                    _resource_cache = await asyncio.to_thread(
+                        _collect_resource_metrics, cpu_count
+                    )
+                    _resource_refresher = asyncio.create_task(_refresh_resource_metrics(
+                        cpu_count, RESOURCE_REFRESH_INTERVAL_SECONDS
+                    ))
         
+        metrics = dict(_resource_cache)
         monitoring_time = time.time() - start_time
-        
-        metrics = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "monitoring_time_seconds": monitoring_time,
-            "cpu": {
-                "utilization_percent": cpu_percent,
-                "core_count": cpu_count,
-                "load_average": psutil.getloadavg() if hasattr(psutil, 'getloadavg') else None
-            },
-            "memory": {
-                "utilization_percent": memory_percent,
-                "total_gb": memory.total / (1024**3),
-                "available_gb": memory_available_gb,
-                "used_gb": memory.used / (1024**3)
-            },
-            "disk": {
-                "utilization_percent": disk_percent,
-                "total_gb": disk.total / (1024**3),
-                "free_gb": disk_free_gb,
-                "used_gb": disk.used / (1024**3)
-            },
-            "network": {
-                "bytes_sent": network.bytes_sent,
-                "bytes_received": network.bytes_recv,
-                "packets_sent": network.packets_sent,
-                "packets_received": network.packets_recv
-            }
-        }
+        metrics["monitoring_time_seconds"] = monitoring_time
         
         logger.debug(
             "System resource monitoring completed",
-            cpu_percent=cpu_percent,
-            memory_percent=memory_percent,
-            disk_percent=disk_percent,
+            cpu_percent=metrics["cpu"]["utilization_percent"],
+            memory_percent=metrics["memory"]["utilization_percent"],
+            disk_percent=metrics["disk"]["utilization_percent"],
             monitoring_time_seconds=monitoring_time
         )
         
         return metrics
         
-    except ImportError:
-        # Fallback when psutil is not available
-        logger.warning("psutil not available, using mock resource metrics")
-        
-        return {
-            "timestamp": datetime.utcnow().isoformat(),
-            "monitoring_time_seconds": time.time() - start_time,
-            "cpu": {"utilization_percent": 50.0, "core_count": 4},
-            "memory": {
-                "utilization_percent": 60.0,
-                "total_gb": 16.0,
-                "available_gb": 6.4,
-                "used_gb": 9.6
-            },
-            "disk": {
-                "utilization_percent": 70.0,
-                "total_gb": 500.0,
-                "free_gb": 150.0,
-                "used_gb": 350.0
-            },
-            "network": {
-                "bytes_sent": 1024*1024*100,  # 100 MB
-                "bytes_received": 1024*1024*200,  # 200 MB
-                "packets_sent": 10000,
-                "packets_received": 15000
-            }
-        }
-    
     except Exception as e:
         logger.error(
             "System resource monitoring failed",
@@ -424,6 +732,21 @@ async def monitor_system_resources() -> Dict[str, Any]:
         )
 
 
+async def _run_cleanup_task(operation_id: str, task: str) -> str:
+    """Run a single cleanup task for an operation."""
+    # Simulate cleanup work
+    await asyncio.sleep(0.1)
+    
+    if _DEBUG_ENABLED:
+        logger.debug(
+            "Cleanup task completed",
+            operation_id=operation_id,
+            task=task
+        )
+    
+    return task
+
+
 @activity.defn
 async def cleanup_processing_artifacts(operation_id: str) -> Dict[str, Any]:
     """
@@ -452,28 +775,25 @@ async def cleanup_processing_artifacts(operation_id: str) -> Dict[str, Any]:
             "Update processing logs"
         ]
         
-        completed_tasks = []
-        failed_tasks = []
+        # The cleanup tasks are independent, so run them concurrently
+        results = await asyncio.gather(
+            *(_run_cleanup_task(operation_id, task) for task in cleanup_tasks),
+            return_exceptions=True
+        )
         
-        for task in cleanup_tasks:
-            try:
-                # Simulate cleanup work
-                await asyncio.sleep(0.1)
-                completed_tasks.append(task)
-                
-                logger.debug(
-                    "Cleanup task completed",
-                    operation_id=operation_id,
-                    task=task
-                )
-                
-            except Exception as e:
-                failed_tasks.append({"task": task, "error": str(e)})
+        completed_tasks = [
+            task for task, outcome in zip(cleanup_tasks, results)
+            if not isinstance(outcome, BaseException)
+        ]
+        failed_tasks = []
+        for task, outcome in zip(cleanup_tasks, results):
+            if isinstance(outcome, BaseException):
+                failed_tasks.append({"task": task, "error": str(outcome)})
                 logger.error(
                     "Cleanup task failed",
                     operation_id=operation_id,
                     task=task,
-                    error=str(e)
+                    error=str(outcome)
                 )
         
         cleanup_time = time.time() - start_time
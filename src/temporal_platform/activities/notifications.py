@@ -3,20 +3,108 @@ Notification activities implementing Pattern 3: Fire-and-Forget.
 Demonstrates background task execution without waiting for completion.
 """
 import asyncio
+import itertools
 import json
+import random
 import time
-from typing import Dict, List, Any, Optional
+from collections import deque
+from functools import lru_cache
+from typing import Deque, Dict, List, Any, Optional, Tuple
 from datetime import datetime
 from temporalio import activity
 import structlog
 import httpx
 
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib encoder
+    orjson = None
+
 from ..models.workflows import NotificationEvent, Priority
 from ..exceptions.core import ActivityExecutionError, RateLimitError
 from ..config.settings import settings
 
 logger = structlog.get_logger(__name__)
 
+# Simulated delays and failure injection stand in for real integrations, which
+# replace them in production
+_SIMULATE_IO = not settings.is_production()
+
+# Per-worker sequence that keeps generated message and audit ids unique
+_id_counter = itertools.count()
+
+# Webhook headers that are the same for every notification
+_STATIC_HEADERS = {
+    "Content-Type": "application/json",
+    "User-Agent": "TemporalPlatform/1.0"
+}
+
+# Webhook authentication, read once since settings don't change after load
+_AUTH_HEADER = settings.security.api_key_header
+_AUTH_SECRET = settings.security.jwt_secret
+_AUTH_ENABLED = bool(_AUTH_HEADER and _AUTH_SECRET)
+
+# Simulated email sending delay multiplier per priority
+_PRIORITY_SENDING_MULTIPLIER = {
+    Priority.CRITICAL: 0.1,
+    Priority.HIGH: 0.3,
+    Priority.MEDIUM: 1.0,
+    Priority.LOW: 2.0
+}
+
+# Webhook client shared by every activity in the worker, so repeat deliveries
+# reuse pooled keep-alive connections instead of reconnecting each time
+_http_client: Optional[httpx.AsyncClient] = None
+
+# Bytes of a webhook response body read for results and error messages
+RESPONSE_BODY_LIMIT = 2048
+
+# Webhook statuses worth retrying (429 is handled separately); any other error
+# status, such as 400, 404 or 501, will not succeed on a retry
+_RETRYABLE_STATUS = frozenset({408, 500, 502, 503, 504})
+
+
+def _dumps_json(payload: Dict[str, Any]) -> bytes:
+    """Encode a webhook payload as JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+async def _read_body_prefix(response: httpx.Response, limit: int) -> str:
+    """Read at most ``limit`` bytes of a streamed response body as text."""
+    chunks = []
+    size = 0
+    async for chunk in response.aiter_bytes():
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= limit:
+            break
+    return b"".join(chunks)[:limit].decode("utf-8", errors="replace")
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=100,
+                max_connections=200,
+                keepalive_expiry=60.0
+            )
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client; called when the worker shuts down."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 
 @activity.defn
 async def send_webhook_notification(notification: NotificationEvent) -> Dict[str, Any]:
@@ -44,28 +132,31 @@ async def send_webhook_notification(notification: NotificationEvent) -> Dict[str
     )
     
     try:
+        # The model stores enum values, so the priority may already be a plain str
+        priority = Priority(notification.priority).value
+        timestamp = notification.created_at.isoformat()
+        
         # Prepare webhook payload
         payload = {
             "id": notification.id,
             "event_type": notification.event_type,
             "source_workflow_id": notification.source_workflow_id,
-            "timestamp": notification.created_at.isoformat(),
-            "priority": notification.priority.value,
+            "timestamp": timestamp,
+            "priority": priority,
             "data": notification.event_data
         }
         
         # Prepare headers
         headers = {
-            "Content-Type": "application/json",
-            "User-Agent": "TemporalPlatform/1.0",
+            **_STATIC_HEADERS,
             "X-Event-Type": notification.event_type,
-            "X-Priority": notification.priority.value,
-            "X-Timestamp": notification.created_at.isoformat()
+            "X-Priority": priority,
+            "X-Timestamp": timestamp
         }
         
         # Add authentication if configured
-        if settings.security.api_key_header and settings.security.jwt_secret:
-            headers[settings.security.api_key_header] = settings.security.jwt_secret
+        if _AUTH_ENABLED:
+            headers[_AUTH_HEADER] = _AUTH_SECRET
         
         # Configure retry policy
         retry_config = notification.retry_policy or {
@@ -160,111 +251,124 @@ async def _send_webhook_with_retries(
     initial_delay = retry_config.get("initial_delay", 1)
     max_delay = retry_config.get("max_delay", 60)
     backoff_multiplier = retry_config.get("backoff_multiplier", 2)
+    jitter_mode = retry_config.get("jitter_mode", "full")
     
     last_error = None
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        for attempt in range(1, max_attempts + 1):
-            try:
-                logger.debug(
-                    "Sending webhook request",
-                    url=url,
-                    attempt=attempt,
-                    max_attempts=max_attempts
-                )
+    client = get_http_client()
+    # Serialized once and re-sent as-is on every attempt
+    body = _dumps_json(payload)
+    
+    for attempt in range(1, max_attempts + 1):
+        try:
+            logger.debug(
+                "Sending webhook request",
+                url=url,
+                attempt=attempt,
+                max_attempts=max_attempts
+            )
+            
+            # Only the start of the body is ever reported, so don't buffer the rest
+            async with client.stream(
+                "POST",
+                url,
+                content=body,
+                headers=headers
+            ) as response:
+                response_text = await _read_body_prefix(response, RESPONSE_BODY_LIMIT)
+            
+            # Check if request was successful
+            if response.status_code < 400:
+                return {
+                    "success": True,
+                    "attempts": attempt,
+                    "status_code": response.status_code,
+                    "response_headers": dict(response.headers),
+                    "response_body": response_text[:500] or None
+                }
+            
+            # Handle specific HTTP errors
+            if response.status_code == 429:  # Rate limited
+                retry_after = response.headers.get("Retry-After", initial_delay)
+                try:
+                    retry_delay = int(retry_after)
+                except (ValueError, TypeError):
+                    retry_delay = initial_delay
                 
-                response = await client.post(
+                logger.warning(
+                    "Webhook rate limited",
                     url=url,
-                    json=payload,
-                    headers=headers
+                    attempt=attempt,
+                    retry_after=retry_delay,
+                    status_code=response.status_code
                 )
                 
-                # Check if request was successful
-                if response.status_code < 400:
-                    return {
-                        "success": True,
-                        "attempts": attempt,
-                        "status_code": response.status_code,
-                        "response_headers": dict(response.headers),
-                        "response_body": response.text[:500] if response.text else None
-                    }
-                
-                # Handle specific HTTP errors
-                if response.status_code == 429:  # Rate limited
-                    retry_after = response.headers.get("Retry-After", initial_delay)
-                    try:
-                        retry_delay = int(retry_after)
-                    except (ValueError, TypeError):
-                        retry_delay = initial_delay
-                    
-                    logger.warning(
-                        "Webhook rate limited",
-                        url=url,
-                        attempt=attempt,
-                        retry_after=retry_delay,
-                        status_code=response.status_code
-                    )
-                    
-                    if attempt < max_attempts:
-                        await asyncio.sleep(min(retry_delay, max_delay))
-                        continue
-                    else:
-                        raise RateLimitError(
-                            f"Webhook rate limited after {max_attempts} attempts",
-                            retry_after_seconds=retry_delay
-                        )
-                
-                elif 400 <= response.status_code < 500:
-                    # Client errors - don't retry
-                    return {
-                        "success": False,
-                        "attempts": attempt,
-                        "status_code": response.status_code,
-                        "error_message": f"Client error: {response.status_code} - {response.text[:200]}",
-                        "response_headers": dict(response.headers)
-                    }
-                
+                if attempt < max_attempts:
+                    # The server hinted a delay, so only spread retries below it
+                    if jitter_mode != "none":
+                        retry_delay = random.uniform(0.5 * retry_delay, retry_delay)
+                    await asyncio.sleep(min(retry_delay, max_delay))
+                    continue
                 else:
-                    # Server errors - retry
-                    last_error = f"Server error: {response.status_code} - {response.text[:200]}"
-                    logger.warning(
-                        "Webhook server error",
-                        url=url,
-                        attempt=attempt,
-                        status_code=response.status_code,
-                        error=last_error
+                    raise RateLimitError(
+                        f"Webhook rate limited after {max_attempts} attempts",
+                        retry_after_seconds=retry_delay
                     )
-                
-            except httpx.RequestError as e:
-                last_error = f"Network error: {str(e)}"
+            
+            elif response.status_code in _RETRYABLE_STATUS:
+                # Transient server errors and timeouts - retry
+                last_error = f"Server error: {response.status_code} - {response_text[:200]}"
                 logger.warning(
-                    "Webhook network error",
+                    "Webhook server error",
                     url=url,
                     attempt=attempt,
+                    status_code=response.status_code,
                     error=last_error
                 )
             
-            except Exception as e:
-                last_error = f"Unexpected error: {str(e)}"
-                logger.error(
-                    "Webhook unexpected error",
-                    url=url,
-                    attempt=attempt,
-                    error=last_error,
-                    error_type=type(e).__name__
-                )
+            else:
+                # Client errors and permanent server errors - don't retry
+                error_kind = "Client error" if response.status_code < 500 else "Server error"
+                return {
+                    "success": False,
+                    "attempts": attempt,
+                    "status_code": response.status_code,
+                    "error_message": f"{error_kind}: {response.status_code} - {response_text[:200]}",
+                    "response_headers": dict(response.headers)
+                }
             
-            # Calculate delay before next retry
-            if attempt < max_attempts:
-                delay = min(initial_delay * (backoff_multiplier ** (attempt - 1)), max_delay)
-                logger.debug(
-                    "Retrying webhook after delay",
-                    url=url,
-                    attempt=attempt,
-                    next_delay_seconds=delay
-                )
-                await asyncio.sleep(delay)
-    
+        except httpx.RequestError as e:
+            last_error = f"Network error: {str(e)}"
+            logger.warning(
+                "Webhook network error",
+                url=url,
+                attempt=attempt,
+                error=last_error
+            )
+        
+        except Exception as e:
+            last_error = f"Unexpected error: {str(e)}"
+            logger.error(
+                "Webhook unexpected error",
+                url=url,
+                attempt=attempt,
+                error=last_error,
+                error_type=type(e).__name__
+            )
+        
+        # Calculate delay before next retry
+        if attempt < max_attempts:
+            delay = _backoff_delay(
+                attempt, initial_delay, max_delay, backoff_multiplier, jitter_mode
+            )
+            logger.debug(
+                "Retrying webhook after delay",
+                url=url,
+                attempt=attempt,
+                next_delay_seconds=delay
+            )
+            await asyncio.sleep(delay)
+
     # All attempts failed
     return {
         "success": False,
@@ -273,6 +377,36 @@ async def _send_webhook_with_retries(
     }
 
 
+def _backoff_delay(
+    attempt: int,
+    initial_delay: float,
+    max_delay: float,
+    backoff_multiplier: float,
+    jitter_mode: str = "full"
+) -> float:
+    """
+    Delay before the retry that follows ``attempt``.
+    
+    Jitter keeps webhooks that failed together from retrying in lock-step:
+    "full" picks uniformly up to the capped exponential delay, "equal" keeps
+    at least half of it, and "none" uses the exponential delay as-is.
+    """
+    delay = min(initial_delay * (backoff_multiplier ** (attempt - 1)), max_delay)
+    if jitter_mode == "full":
+        return random.uniform(0, delay)
+    if jitter_mode == "equal":
+        return random.uniform(delay / 2, delay)
+    return delay
+
+
+@lru_cache(maxsize=10_000)
+def _validate_email(address: str) -> None:
+    """Check the address has a domain with a dot after its last '@'."""
+    _, at, domain = address.rpartition("@")
+    if not at or "." not in domain:
+        raise ValueError(f"Invalid email address: {address}")
+
+
 @activity.defn
 async def send_email_notification(
     recipient: str,
@@ -313,36 +447,30 @@ async def send_email_notification(
         # - SMTP server
         
         # Simulate email preparation and validation
-        await asyncio.sleep(0.1)
+        if _SIMULATE_IO:
+            await asyncio.sleep(0.1)
         
         # Validate email address format
-        if "@" not in recipient or "." not in recipient.split("@")[-1]:
-            raise ValueError(f"Invalid email address: {recipient}")
+        _validate_email(recipient)
         
-        # Simulate email sending delay based on content size and priority
         content_size = len(content.encode('utf-8'))
-        base_delay = 0.5  # Base sending delay
-        
-        # Priority affects sending delay
-        priority_multipliers = {
-            Priority.CRITICAL: 0.1,
-            Priority.HIGH: 0.3,
-            Priority.MEDIUM: 1.0,
-            Priority.LOW: 2.0
-        }
-        
-        sending_delay = base_delay * priority_multipliers[priority]
-        
-        # Large content takes longer to send
-        if content_size > 10000:  # 10KB
-            sending_delay *= 1.5
         
-        await asyncio.sleep(sending_delay)
-        
-        # Simulate occasional failures (2% failure rate)
-        import random
-        if random.random() < 0.02:
-            raise Exception("Email service temporarily unavailable")
+        if _SIMULATE_IO:
+            # Simulate email sending delay based on content size and priority
+            base_delay = 0.5  # Base sending delay
+            
+            # Priority affects sending delay
+            sending_delay = base_delay * _PRIORITY_SENDING_MULTIPLIER[priority]
+            
+            # Large content takes longer to send
+            if content_size > 10000:  # 10KB
+                sending_delay *= 1.5
+            
+            await asyncio.sleep(sending_delay)
+            
+            # Simulate occasional failures (2% failure rate)
+            if random.random() < 0.02:
+                raise Exception("Email service temporarily unavailable")
         
         delivery_time = time.time() - start_time
         
@@ -354,7 +482,7 @@ async def send_email_notification(
             "priority": priority.value,
             "delivery_status": "sent",
             "delivery_time_seconds": delivery_time,
-            "message_id": f"msg_{int(time.time())}_{hash(recipient) % 10000}",
+            "message_id": f"msg_{time.time_ns():x}_{next(_id_counter):x}",
             "smtp_response": "250 2.0.0 Message accepted for delivery"
         }
         
@@ -427,7 +555,7 @@ async def log_audit_event(
     try:
         # Create audit log entry
         audit_entry = {
-            "id": f"audit_{int(time.time())}_{hash(user_id + resource_id) % 10000}",
+            "id": f"audit_{time.time_ns():x}_{next(_id_counter):x}",
             "timestamp": datetime.utcnow().isoformat(),
             "event_type": event_type,
             "user_id": user_id,
@@ -438,17 +566,8 @@ async def log_audit_event(
             "version": "1.0.0"
         }
         
-        # Simulate audit log storage
-        # In production, this would store to:
-        # - Elasticsearch for search and analysis
-        # - PostgreSQL for relational queries
-        # - AWS CloudTrail for compliance
-        # - Splunk for enterprise monitoring
-        
-        await asyncio.sleep(0.1)  # Simulate storage operation
-        
-        # Simulate indexing for search
-        await asyncio.sleep(0.05)
+        # Stored together with other pending entries in one bulk write
+        await _audit_batcher.add(audit_entry)
         
         logging_time = time.time() - start_time
         
@@ -497,6 +616,178 @@ async def log_audit_event(
         )
 
 
+class AuditBatcher:
+    """
+    Coalesce audit entries into bulk writes.
+    
+    Entries are flushed once ``max_size`` are pending or ``wait_ms`` has passed
+    since the batch was started, whichever comes first. ``add`` returns when the
+    bulk write containing the entry has finished, and raises if it failed, so
+    each log_audit_event activity still reports its own outcome.
+    """
+    
+    def __init__(self, max_size: int = 100, wait_ms: int = 250):
+        self.max_size = max_size
+        self.wait_seconds = wait_ms / 1000
+        self._buffer: Deque[Tuple[Dict[str, Any], asyncio.Future]] = deque()
+        self._full = asyncio.Event()
+        self._worker: Optional[asyncio.Task] = None
+        # Once closing, pending entries are written without waiting for a batch
+        self._closing = False
+    
+    async def add(self, entry: Dict[str, Any]) -> None:
+        """Queue an entry and wait until it has been written."""
+        future = asyncio.get_running_loop().create_future()
+        self._buffer.append((entry, future))
+        if len(self._buffer) >= self.max_size:
+            self._full.set()
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+        await future
+    
+    async def aclose(self) -> None:
+        """Write every buffered entry now and wait for it; called on worker shutdown."""
+        self._closing = True
+        self._full.set()
+        if self._buffer and (self._worker is None or self._worker.done()):
+            self._worker = asyncio.create_task(self._run())
+        if self._worker is not None:
+            await self._worker
+    
+    async def _run(self) -> None:
+        # Exits once the buffer is drained; the next add starts a new worker
+        while self._buffer:
+            try:
+                await asyncio.wait_for(self._full.wait(), self.wait_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._full.clear()
+            
+            batch = [
+                self._buffer.popleft()
+                for _ in range(min(len(self._buffer), self.max_size))
+            ]
+            if self._closing or len(self._buffer) >= self.max_size:
+                self._full.set()
+            
+            try:
+                await _write_audit_entries([entry for entry, _ in batch])
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_result(None)
+
+
+async def _write_audit_entries(entries: List[Dict[str, Any]]) -> None:
+    """Store a batch of audit entries with a single bulk request."""
+    # Simulate audit log storage
+    # In production, this would bulk-store to:
+    # - Elasticsearch (_bulk API) for search and analysis
+    # - PostgreSQL (COPY) for relational queries
+    # - AWS CloudTrail for compliance
+    # - Splunk for enterprise monitoring
+    
+    if _SIMULATE_IO:
+        await asyncio.sleep(0.1)  # Simulate storage operation
+        
+        # Simulate indexing for search
+        await asyncio.sleep(0.05)
+    
+    logger.debug("Audit entries stored", entry_count=len(entries))
+
+
+_audit_batcher = AuditBatcher()
+
+
+async def close_audit_batcher() -> None:
+    """Flush buffered audit entries; called on worker shutdown."""
+    await _audit_batcher.aclose()
+
+
+# Metric samples waiting to be pushed; when full the oldest samples are dropped
+METRIC_QUEUE_SIZE = 10_000
+METRIC_PUSH_BATCH_SIZE = 500
+_metric_queue: asyncio.Queue = asyncio.Queue(maxsize=METRIC_QUEUE_SIZE)
+_metric_flusher: Optional[asyncio.Task] = None
+_dropped_metrics = 0
+
+
+def start_metric_flusher() -> None:
+    """Start the background metrics flusher; called when the worker starts."""
+    global _metric_flusher
+    if _metric_flusher is None or _metric_flusher.done():
+        _metric_flusher = asyncio.create_task(_flush_metrics())
+
+
+async def close_metric_flusher() -> None:
+    """Push every queued metric sample, then stop the flusher; called on worker shutdown."""
+    global _metric_flusher
+    if not _metric_queue.empty():
+        start_metric_flusher()
+    if _metric_flusher is not None:
+        await _metric_queue.join()
+        _metric_flusher.cancel()
+        try:
+            await _metric_flusher
+        except asyncio.CancelledError:
+            pass
+        _metric_flusher = None
+
+
+def _enqueue_metric(metric_entry: Dict[str, Any]) -> None:
+    """Queue a metric sample for the background flusher without waiting on I/O."""
+    global _dropped_metrics
+    if _metric_queue.full():
+        _metric_queue.get_nowait()
+        _metric_queue.task_done()
+        _dropped_metrics += 1
+        if _dropped_metrics % 1000 == 1:
+            logger.warning(
+                "Metric queue full, dropping oldest samples",
+                dropped_total=_dropped_metrics
+            )
+    _metric_queue.put_nowait(metric_entry)
+
+
+async def _flush_metrics() -> None:
+    """Drain queued metric samples and push them in batches."""
+    while True:
+        batch = [await _metric_queue.get()]
+        while len(batch) < METRIC_PUSH_BATCH_SIZE and not _metric_queue.empty():
+            batch.append(_metric_queue.get_nowait())
+        
+        try:
+            await _push_metrics(batch)
+        except Exception as e:
+            # Metrics failures are non-critical; drop the batch and carry on
+            logger.warning(
+                "Metrics push failed",
+                sample_count=len(batch),
+                error=str(e),
+                error_type=type(e).__name__
+            )
+        finally:
+            for _ in batch:
+                _metric_queue.task_done()
+
+
+async def _push_metrics(metric_entries: List[Dict[str, Any]]) -> None:
+    """Push a batch of metric samples to the metrics backend in one request."""
+    # Simulate metrics storage
+    # In production, this would push to:
+    # - Prometheus for time-series storage
+    # - InfluxDB for high-cardinality metrics
+    # - CloudWatch for AWS environments
+    # - Datadog for SaaS monitoring
+    
+    if _SIMULATE_IO:
+        await asyncio.sleep(0.02)  # Simulate metrics push
+
+
 @activity.defn
 async def update_metrics_dashboard(
     metric_name: str,
@@ -531,22 +822,18 @@ async def update_metrics_dashboard(
         metric_timestamp = timestamp or datetime.utcnow()
         metric_labels = labels or {}
         
+        metric_timestamp_iso = metric_timestamp.isoformat()
+        
         metric_entry = {
             "name": metric_name,
             "value": metric_value,
             "labels": metric_labels,
-            "timestamp": metric_timestamp.isoformat(),
+            "timestamp": metric_timestamp_iso,
             "source": "temporal-platform"
         }
         
-        # Simulate metrics storage
-        # In production, this would push to:
-        # - Prometheus for time-series storage
-        # - InfluxDB for high-cardinality metrics
-        # - CloudWatch for AWS environments
-        # - Datadog for SaaS monitoring
-        
-        await asyncio.sleep(0.02)  # Simulate metrics push
+        # Pushed to the backend in the background together with other samples
+        _enqueue_metric(metric_entry)
         
         update_time = time.time() - start_time
         
@@ -554,8 +841,8 @@ async def update_metrics_dashboard(
             "metric_name": metric_name,
             "metric_value": metric_value,
             "labels": metric_labels,
-            "timestamp": metric_timestamp.isoformat(),
-            "update_status": "success",
+            "timestamp": metric_timestamp_iso,
+            "update_status": "queued",
             "update_time_seconds": update_time,
             "metrics_backend": "prometheus",
             "scrape_interval_seconds": 15
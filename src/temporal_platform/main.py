@@ -125,6 +125,7 @@ def start_worker(
                 
                 # Long-running operation activities
                 long_running.process_large_dataset,
+                long_running.process_large_dataset_batch,
                 long_running.monitor_system_resources,
                 long_running.cleanup_processing_artifacts,
                 
@@ -136,8 +137,17 @@ def start_worker(
             ]
         )
         
+        notifications.start_metric_flusher()
+        
         logger.info("Worker started successfully")
-        await worker.run()
+        try:
+            await worker.run()
+        finally:
+            # Deliver queued metrics and audit entries before the client goes away
+            await notifications.close_metric_flusher()
+            await notifications.close_audit_batcher()
+            await notifications.close_http_client()
+            await long_running.close_resource_refresher()
     
     asyncio.run(run_worker())
 